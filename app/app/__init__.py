@@ -96,6 +96,21 @@ async def on_app_start(app: rio.App) -> None:
     app.default_attachments.append(pers)
 
 
+async def on_app_close(app: rio.App) -> None:
+    # The facade attached in `on_app_start` holds its connections for the life
+    # of the process. Refresh the planner statistics gathered by this thread's
+    # connection (the one Rio's event loop uses) once on the way out.
+    try:
+        pers = app[Persistence]
+    except KeyError:
+        return
+
+    try:
+        pers.optimize()
+    finally:
+        pers.close()
+
+
 async def on_session_start(rio_session: rio.Session) -> None:
     # A new user has just connected. Check if they have a valid auth token.
     #
@@ -155,6 +170,7 @@ app = rio.App(
     },
     default_attachments=[UserSettings(auth_token='')],
     on_app_start=on_app_start,
+    on_app_close=on_app_close,
     on_session_start=on_session_start,
     build=RootComponent,
     theme=theme.DARK_THEME,
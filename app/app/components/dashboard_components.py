@@ -5,6 +5,9 @@ from typing import Optional
 import rio
 
 
+_DELTA_NEUTRAL_COLOR = rio.Color.from_hex('#7F8C8D')  # Gray
+_DELTA_UP_COLOR = rio.Color.from_hex('#2ECC71')
+_DELTA_DOWN_COLOR = rio.Color.from_hex('#E74C3C')
 
 
 class DeltaCard(rio.Component):
@@ -19,8 +22,8 @@ class DeltaCard(rio.Component):
     def build(self) -> rio.Component:
         def get_delta_color(delta: Optional[float]) -> rio.Color:
             if delta is None or delta == 0:
-                return rio.Color.from_hex('#7F8C8D')  # Gray
-            return rio.Color.from_hex('#2ECC71') if delta > 0 else rio.Color.from_hex('#E74C3C')
+                return _DELTA_NEUTRAL_COLOR
+            return _DELTA_UP_COLOR if delta > 0 else _DELTA_DOWN_COLOR
 
         def format_delta(delta: Optional[float]) -> str:
             if delta is None:
@@ -95,6 +95,13 @@ class AppConfig:
     MAX_PASSWORD_LENGTH: int = 1024
     PASSWORD_STRENGTH_WARNING_THRESHOLD: int = 50
     ALLOW_WEAK_PASSWORDS: bool = True
+    # Argon2id cost for newly stored password hashes. The defaults follow the
+    # OWASP low-memory profile (19 MiB, 2 passes, 1 lane) rather than the 64 MiB
+    # library default, so concurrent logins need far less RAM. Hashes created
+    # with other parameters are upgraded transparently on the next login.
+    PASSWORD_HASH_TIME_COST: int = 2
+    PASSWORD_HASH_MEMORY_COST_KIB: int = 19456
+    PASSWORD_HASH_PARALLELISM: int = 1
     # Recovery codes currently use a very long TTL to behave like "backup codes"
     # while still supporting explicit expiry checks in persistence.
     RECOVERY_CODE_TTL_DAYS: int = 36500  # ~100 years; effectively never expires
@@ -38,6 +38,7 @@ from app.scripts.utils import (
     get_password_policy_decision,
     get_password_strength,
     get_password_strength_color,
+    get_password_strength_style,
     get_password_strength_status,
 )
 from app.components.center_component import CenterComponent
@@ -2082,10 +2083,8 @@ class AdminPage(ResponsiveComponent):
             rio.Text(
                 f"Password strength: {self.create_user_password_strength}, "
                 f"{get_password_strength_status(self.create_user_password_strength)}",
-                style=rio.TextStyle(
-                    fill=get_password_strength_color(
-                        self.create_user_password_strength
-                    )
+                style=get_password_strength_style(
+                    self.create_user_password_strength
                 ),
             ),
             rio.ProgressBar(
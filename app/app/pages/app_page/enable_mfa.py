@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import io
 import logging
 import qrcode
@@ -275,7 +276,10 @@ class EnableMFA(ResponsiveComponent):
             self.force_refresh()
             return
 
-        if user.auth_provider == "password" and not user.verify_password(self.password):
+        if user.auth_provider == "password" and not await asyncio.to_thread(
+            user.verify_password,
+            self.password,
+        ):
             self.error_message = "Invalid password. Please try again."
             self.force_refresh()
             return
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import timezone
 import logging
 import rio
@@ -236,7 +237,10 @@ class ManageRecoveryCodes(rio.Component):
             self.force_refresh()
             return
 
-        if user.auth_provider == "password" and not user.verify_password(self.password):
+        if user.auth_provider == "password" and not await asyncio.to_thread(
+            user.verify_password,
+            self.password,
+        ):
             self.error_message = "Invalid password. Please try again."
             self.force_refresh()
             return
@@ -23,10 +23,14 @@ from app.components.center_component import CenterComponent
 from app.components.currency_summary import CurrencySummary, CurrencyOverview as CurrencySnapshot
 from app.components.responsive import ResponsiveComponent, WIDTH_COMFORTABLE
 from app.scripts.utils import (
+    VALIDATION_BAD_STYLE,
+    VALIDATION_OK_STYLE,
     build_password_warning_acknowledgement,
     get_password_policy_decision,
     get_password_strength,
     get_password_strength_color,
+    get_password_strength_progress,
+    get_password_strength_style,
     get_password_strength_status,
 )
 from app.validation import SecuritySanitizer
@@ -297,7 +301,9 @@ class Settings(ResponsiveComponent):
 
     def new_password_strength_progress(self) -> rio.Component:
         return rio.ProgressBar(
-            progress=max(0, min(self.change_password_new_password_strength / 100, 1)),
+            progress=get_password_strength_progress(
+                self.change_password_new_password_strength
+            ),
             color=get_password_strength_color(self.change_password_new_password_strength),
         )
 
@@ -814,16 +820,13 @@ class Settings(ResponsiveComponent):
                         # Password strength visuals
                         rio.Text(
                             f"Passwords match: {self.change_password_passwords_match}",
-                            style=rio.TextStyle(
-                                fill=rio.Color.from_rgb(0, 1, 0, srgb=True)
-                                if self.change_password_passwords_match else rio.Color.from_rgb(1, 0, 0, srgb=True)
-                            )
+                            style=VALIDATION_OK_STYLE if self.change_password_passwords_match else VALIDATION_BAD_STYLE,
                         ),
                         rio.Text(
                             f"Password strength: {self.change_password_new_password_strength}, "
                             f"{get_password_strength_status(self.change_password_new_password_strength)}",
-                            style=rio.TextStyle(
-                                fill=get_password_strength_color(self.change_password_new_password_strength)
+                            style=get_password_strength_style(
+                                self.change_password_new_password_strength
                             )
                         ),
                         self.new_password_strength_progress(),
@@ -22,10 +22,13 @@ from app.permissions import check_access
 from app.components.center_component import CenterComponent
 from app.components.responsive import WIDTH_NARROW
 from app.scripts.utils import (
+    VALIDATION_BAD_STYLE,
+    VALIDATION_OK_STYLE,
     build_password_warning_acknowledgement,
     get_password_policy_decision,
-    get_password_strength,
     get_password_strength_color,
+    get_password_strength_progress,
+    get_password_strength_style,
     get_password_strength_status,
 )
 from app.scripts.message_utils import (
@@ -58,7 +61,11 @@ from app.rate_limits import (
 )
 from app.validation import SecuritySanitizer
 from app.config import config
-from app.password_policy import account_password_context, evaluate_new_password
+from app.password_policy import (
+    PasswordPolicyDecision,
+    account_password_context,
+    evaluate_new_password,
+)
 
 
 def guard(event: rio.GuardEvent) -> str | None:
@@ -143,6 +150,35 @@ def _login_destination(session: rio.Session, user_role: str) -> str:
 _SOCIAL_LOGIN_FLOW_ID_PATTERN = re.compile(r"[0-9a-f]{32}\Z")
 
 
+def _passwords_match(password: str, confirmation: str) -> bool:
+    """
+    Compare a password with its confirmation in constant time. Encoded first
+    because `hmac.compare_digest` only accepts ASCII `str` input.
+    """
+    return hmac.compare_digest(
+        password.encode("utf-8", "surrogatepass"),
+        confirmation.encode("utf-8", "surrogatepass"),
+    )
+
+
+def _has_email_shape(value: str) -> bool:
+    """
+    Cheap structural check (one @, non-empty local part, dotted domain, ASCII
+    with no whitespace or control characters) used to skip the full email
+    validator for input that can never pass it.
+    """
+    candidate = value.strip()
+    if not candidate.isascii() or not candidate.isprintable() or " " in candidate:
+        return False
+    local_part, at_sign, domain = candidate.rpartition("@")
+    return (
+        bool(at_sign)
+        and bool(local_part)
+        and "@" not in local_part
+        and "." in domain.strip(".")
+    )
+
+
 def _oauth_error_message(error_code: str) -> str:
     messages = {
         "provider_failed": "Google sign-in failed. Please try again.",
@@ -271,8 +307,12 @@ class LoginForm(rio.Component):
                 self.error_message = "Invalid email or password. Please try again."
                 return
 
-            # Make sure their password matches
-            password_result = user_info.verify_password_result(self.password)
+            # Make sure their password matches. Hash verification is CPU-bound,
+            # so keep it off the event loop serving other sessions.
+            password_result = await asyncio.to_thread(
+                user_info.verify_password_result,
+                self.password,
+            )
             if not password_result.ok:
                 self.pending_verification_email = ""
                 self.banner_style = "danger"
@@ -534,6 +574,9 @@ class SignUpForm(rio.Component):
     do_passwords_match: bool = False
     acknowledge_weak_password: bool = False
     password_policy_error_visible: bool = False
+    _password_strength_progress: float = 0.0
+    _password_policy: PasswordPolicyDecision | None = None
+    _password_policy_input: tuple[str, str] | None = None
 
     # We'll expose an event so that the parent page can toggle forms
     on_toggle_form: t.Callable[[str], None] | None = None
@@ -579,7 +622,7 @@ class SignUpForm(rio.Component):
             return
 
         # Check if the passwords match
-        if self.password != self.confirm_password:
+        if not _passwords_match(self.password, self.confirm_password):
             self.banner_style = "danger"
             self.error_message = "Passwords do not match"
             self.passwords_valid = False
@@ -622,16 +665,12 @@ class SignUpForm(rio.Component):
             return
 
         # Check if the email is already registered
-        try:
-            await pers.get_user_by_email(email=self.email)
+        if await pers.email_exists(email=self.email):
             self.banner_style = "danger"
             self.error_message = "This email is already registered"
             self.is_email_valid = False
             self.passwords_valid = True
             return
-        except KeyError:
-            # Good news, we can create the user.
-            pass
 
         # Create and store the user through the policy-enforcing plaintext
         # boundary. AppUser instances only contain hashes, which cannot be
@@ -700,6 +739,8 @@ class SignUpForm(rio.Component):
         self.email = ""
         self.password = ""
         self.confirm_password = ""
+        self._password_policy = None
+        self._password_policy_input = None
         self.referral_code = ""
         self.acknowledge_weak_password = False
         self.error_message = ""
@@ -724,50 +765,68 @@ class SignUpForm(rio.Component):
         Respects the global config setting for email validation.
         """
         try:
-            if email:
+            if not email:
+                self.is_email_valid = False
+            elif config.REQUIRE_VALID_EMAIL and not _has_email_shape(email):
+                # Most keystrokes produce a partial address; reject those
+                # without running the full validator.
+                self.banner_style = "danger"
+                self.is_email_valid = False
+            else:
                 # Use config setting for validation
                 SecuritySanitizer.validate_email_format(email, require_valid=config.REQUIRE_VALID_EMAIL)
                 self.is_email_valid = True
-            else:
-                self.is_email_valid = False
         except Exception:
             self.banner_style = "danger"
             self.is_email_valid = False
 
-    async def update_email(self, event: rio.TextInputChangeEvent):
-        self.email = event.text
-        self.validate_email(self.email)
-        self.acknowledge_weak_password = False
-        self.password_strength = get_password_strength(
+    def _current_password_policy(self) -> PasswordPolicyDecision:
+        """
+        Return the live policy decision, reusing the last one while neither the
+        password nor the email it is checked against has changed.
+        """
+        if (
+            self._password_policy is not None
+            and self._password_policy_input == (self.password, self.email)
+        ):
+            return self._password_policy
+        return get_password_policy_decision(
             self.password,
             expected_passwords=account_password_context(email=self.email),
         )
+
+    def _update_password_strength(self) -> None:
+        self._password_policy = self._current_password_policy()
+        self._password_policy_input = (self.password, self.email)
+        self.password_strength = self._password_policy.strength
+        self._password_strength_progress = get_password_strength_progress(
+            self.password_strength
+        )
+
+    def update_email(self, event: rio.TextInputChangeEvent) -> None:
+        self.email = event.text
+        self.validate_email(self.email)
+        self.acknowledge_weak_password = False
+        self._update_password_strength()
         if self.password_policy_error_visible:
             self.error_message = ""
             self.password_policy_error_visible = False
-        self.force_refresh()
 
-    async def update_password(self, event: rio.TextInputChangeEvent):
+    def update_password(self, event: rio.TextInputChangeEvent) -> None:
         self.password = event.text
         self.acknowledge_weak_password = False
-        self.password_strength = get_password_strength(
-            self.password,
-            expected_passwords=account_password_context(email=self.email),
-        )
+        self._update_password_strength()
         self.do_passwords_match = self.password == self.confirm_password
         if self.password_policy_error_visible:
             self.error_message = ""
             self.password_policy_error_visible = False
-        self.force_refresh()
 
-    async def update_confirm_password(self, event: rio.TextInputChangeEvent):
+    def update_confirm_password(self, event: rio.TextInputChangeEvent) -> None:
         self.confirm_password = event.text
         self.do_passwords_match = self.password == self.confirm_password
-        self.force_refresh()
 
-    async def update_referral_code(self, event: rio.TextInputChangeEvent):
+    def update_referral_code(self, event: rio.TextInputChangeEvent) -> None:
         self.referral_code = event.text
-        self.force_refresh()
 
     def on_acknowledge_weak_password_change(
         self,
@@ -781,15 +840,12 @@ class SignUpForm(rio.Component):
 
     def password_strength_progress(self) -> rio.Component:
         return rio.ProgressBar(
-            progress=max(0, min(self.password_strength / 100, 1)),
+            progress=self._password_strength_progress,
             color=get_password_strength_color(self.password_strength),
         )
 
     def build(self) -> rio.Component:
-        password_policy = get_password_policy_decision(
-            self.password,
-            expected_passwords=account_password_context(email=self.email),
-        )
+        password_policy = self._current_password_policy()
         social_signup_components: list[rio.Component] = []
         if config.ENABLE_GOOGLE_LOGIN:
             social_signup_components.extend(
@@ -844,22 +900,16 @@ class SignUpForm(rio.Component):
                 ),
                 rio.Text(
                     f'Email is valid: {self.is_email_valid}',
-                    style=rio.TextStyle(
-                        fill=rio.Color.from_rgb(0, 1, 0, srgb=True)
-                        if self.is_email_valid else rio.Color.from_rgb(1, 0, 0, srgb=True)
-                    )
+                    style=VALIDATION_OK_STYLE if self.is_email_valid else VALIDATION_BAD_STYLE
                 ),
                 rio.Text(
                     f'Passwords match: {self.do_passwords_match}',
-                    style=rio.TextStyle(
-                        fill=rio.Color.from_rgb(0, 1, 0, srgb=True)
-                        if self.do_passwords_match else rio.Color.from_rgb(1, 0, 0, srgb=True)
-                    ),
+                    style=VALIDATION_OK_STYLE if self.do_passwords_match else VALIDATION_BAD_STYLE,
                 ),
                 rio.Text(
                     f'Password strength: {self.password_strength}, '
                     f'{get_password_strength_status(self.password_strength)}',
-                    style=rio.TextStyle(fill=get_password_strength_color(self.password_strength))
+                    style=get_password_strength_style(self.password_strength)
                 ),
                 self.password_strength_progress(),
                 *(
@@ -1060,6 +1110,34 @@ class SocialMFAForm(rio.Component):
         )
 
 
+class PasswordFeedback(rio.Component):
+    """
+    Shows whether the new passwords match and how strong the new password is.
+    """
+
+    password_strength: int = 0
+    password_strength_progress: float = 0.0
+    do_passwords_match: bool = False
+
+    def build(self) -> rio.Component:
+        return rio.Column(
+            rio.Text(
+                f'Passwords match: {self.do_passwords_match}',
+                style=VALIDATION_OK_STYLE if self.do_passwords_match else VALIDATION_BAD_STYLE,
+            ),
+            rio.Text(
+                f'Password strength: {self.password_strength}, '
+                f'{get_password_strength_status(self.password_strength)}',
+                style=get_password_strength_style(self.password_strength)
+            ),
+            rio.ProgressBar(
+                progress=self.password_strength_progress,
+                color=get_password_strength_color(self.password_strength),
+            ),
+            spacing=1,
+        )
+
+
 class ResetPasswordForm(rio.Component):
     """
     Provides an interface for resetting the user's password with a one-time token.
@@ -1085,6 +1163,9 @@ class ResetPasswordForm(rio.Component):
     prefilled_message: str = ""
     prefilled_message_style: str = "success"
     prefilled_require_two_factor: bool = False
+    _password_strength_progress: float = 0.0
+    _password_policy: PasswordPolicyDecision | None = None
+    _password_policy_input: tuple[str, tuple[str, ...]] | None = None
 
     # We'll expose an event so that the parent page can toggle forms
     on_toggle_form: t.Callable[[str], None] | None = None
@@ -1116,8 +1197,10 @@ class ResetPasswordForm(rio.Component):
         self.reset_token = ""
         self.new_password = ""
         self.confirm_password = ""
+        self._password_policy = None
+        self._password_policy_input = None
         self.verification_code = ""
-        self.password_strength = 0
+        self._set_password_strength(0)
         self.do_passwords_match = False
         self.acknowledge_weak_password = False
         self._set_banner("success", _generic_reset_message())
@@ -1135,6 +1218,36 @@ class ResetPasswordForm(rio.Component):
             username=username,
         )
 
+    def _current_password_policy(self) -> PasswordPolicyDecision:
+        """
+        Return the live policy decision, reusing the last one while neither the
+        new password nor the account context it is checked against has changed.
+        """
+        policy_input = (self.new_password, self._password_expected_values())
+        if (
+            self._password_policy is not None
+            and self._password_policy_input == policy_input
+        ):
+            return self._password_policy
+        return get_password_policy_decision(
+            self.new_password,
+            expected_passwords=policy_input[1],
+        )
+
+    def _update_password_strength(self) -> None:
+        self._password_policy = self._current_password_policy()
+        self._password_policy_input = (
+            self.new_password,
+            self._password_expected_values(),
+        )
+        self._set_password_strength(self._password_policy.strength)
+
+    def _set_password_strength(self, strength: int) -> None:
+        self.password_strength = strength
+        self._password_strength_progress = get_password_strength_progress(
+            strength
+        )
+
     async def on_primary_action(self, _: rio.TextInputConfirmEvent | None = None) -> None:
         """
         Handle the primary button or enter key presses.
@@ -1263,7 +1376,7 @@ class ResetPasswordForm(rio.Component):
             self._set_banner("danger", "Please enter a new password.")
             return
 
-        if self.new_password != self.confirm_password:
+        if not _passwords_match(self.new_password, self.confirm_password):
             self._set_banner("danger", "Passwords do not match.")
             return
 
@@ -1344,7 +1457,7 @@ class ResetPasswordForm(rio.Component):
                 username=user.username,
             ),
         )
-        self.password_strength = password_policy.strength
+        self._set_password_strength(password_policy.strength)
         if not password_policy.ok:
             self._set_banner(
                 "danger",
@@ -1405,6 +1518,8 @@ class ResetPasswordForm(rio.Component):
         self.reset_token = ""
         self.new_password = ""
         self.confirm_password = ""
+        self._password_policy = None
+        self._password_policy_input = None
         self.verification_code = ""
         self.acknowledge_weak_password = False
 
@@ -1418,32 +1533,23 @@ class ResetPasswordForm(rio.Component):
     async def update_email(self, event: rio.TextInputChangeEvent):
         self.email = event.text
         self.acknowledge_weak_password = False
-        self.password_strength = get_password_strength(
-            self.new_password,
-            expected_passwords=self._password_expected_values(),
-        )
+        self._update_password_strength()
         if self.password_policy_error_visible:
             self.error_message = ""
             self.password_policy_error_visible = False
-        self.force_refresh()
 
     async def update_new_password(self, event: rio.TextInputChangeEvent):
         self.new_password = event.text
         self.acknowledge_weak_password = False
-        self.password_strength = get_password_strength(
-            self.new_password,
-            expected_passwords=self._password_expected_values(),
-        )
+        self._update_password_strength()
         self.do_passwords_match = self.new_password == self.confirm_password
         if self.password_policy_error_visible:
             self.error_message = ""
             self.password_policy_error_visible = False
-        self.force_refresh()
 
     async def update_confirm_password(self, event: rio.TextInputChangeEvent):
         self.confirm_password = event.text
         self.do_passwords_match = self.new_password == self.confirm_password
-        self.force_refresh()
 
     def on_acknowledge_weak_password_change(
         self,
@@ -1455,17 +1561,8 @@ class ResetPasswordForm(rio.Component):
             self.password_policy_error_visible = False
         self.force_refresh()
 
-    def password_strength_progress(self) -> rio.Component:
-        return rio.ProgressBar(
-            progress=max(0, min(self.password_strength / 100, 1)),
-            color=get_password_strength_color(self.password_strength),
-        )
-
     def build(self) -> rio.Component:
-        password_policy = get_password_policy_decision(
-            self.new_password,
-            expected_passwords=self._password_expected_values(),
-        )
+        password_policy = self._current_password_policy()
         primary_label = "Update Password" if self.code_sent else "Send Reset Link"
 
         additional_inputs: list[rio.Component] = []
@@ -1504,22 +1601,12 @@ class ResetPasswordForm(rio.Component):
                 )
 
             # Always show password strength indicators when in password reset mode
-            additional_inputs.extend(
-                [
-                    rio.Text(
-                        f'Passwords match: {self.do_passwords_match}',
-                        style=rio.TextStyle(
-                            fill=rio.Color.from_rgb(0, 1, 0, srgb=True)
-                            if self.do_passwords_match else rio.Color.from_rgb(1, 0, 0, srgb=True)
-                        ),
-                    ),
-                    rio.Text(
-                        f'Password strength: {self.password_strength}, '
-                        f'{get_password_strength_status(self.password_strength)}',
-                        style=rio.TextStyle(fill=get_password_strength_color(self.password_strength))
-                    ),
-                    self.password_strength_progress(),
-                ]
+            additional_inputs.append(
+                PasswordFeedback(
+                    password_strength=self.password_strength,
+                    password_strength_progress=self._password_strength_progress,
+                    do_passwords_match=self.do_passwords_match,
+                )
             )
             if (
                 self.new_password
@@ -1804,34 +1891,45 @@ class LoginPage(rio.Component):
             self.pending_social_user_id = ""
             self.pending_social_flow_id = ""
             self.pending_social_binding_digest = ""
-        self.force_refresh()
+
+    def _build_login_form(self) -> rio.Component:
+        return LoginForm(on_toggle_form=self.set_form)
+
+    def _build_signup_form(self) -> rio.Component:
+        return SignUpForm(on_toggle_form=self.set_form)
+
+    def _build_reset_form(self) -> rio.Component:
+        return ResetPasswordForm(
+            on_toggle_form=self.set_form,
+            prefilled_email=self.reset_prefilled_email,
+            prefilled_username=self.reset_prefilled_username,
+            prefilled_reset_token=self.reset_prefilled_token,
+            prefilled_message=self.reset_prefilled_message,
+            prefilled_message_style=self.reset_prefilled_message_style,
+            prefilled_require_two_factor=self.reset_prefilled_require_two_factor,
+        )
+
+    def _build_social_mfa_form(self) -> rio.Component:
+        return SocialMFAForm(
+            on_toggle_form=self.set_form,
+            pending_user_id=self.pending_social_user_id,
+            pending_flow_id=self.pending_social_flow_id,
+            pending_binding_digest=self.pending_social_binding_digest,
+        )
+
+    # Form builders keyed by `current_form`
+    _FORM_BUILDERS = {
+        "login": _build_login_form,
+        "signup": _build_signup_form,
+        "reset": _build_reset_form,
+        "social_mfa": _build_social_mfa_form,
+    }
 
     def build(self) -> rio.Component:
-        # Decide which form to show
-        if self.current_form == "login":
-            form_to_show = LoginForm(on_toggle_form=self.set_form)
-        elif self.current_form == "signup":
-            form_to_show = SignUpForm(on_toggle_form=self.set_form)
-        elif self.current_form == "reset":
-            form_to_show = ResetPasswordForm(
-                on_toggle_form=self.set_form,
-                prefilled_email=self.reset_prefilled_email,
-                prefilled_username=self.reset_prefilled_username,
-                prefilled_reset_token=self.reset_prefilled_token,
-                prefilled_message=self.reset_prefilled_message,
-                prefilled_message_style=self.reset_prefilled_message_style,
-                prefilled_require_two_factor=self.reset_prefilled_require_two_factor,
-            )
-        elif self.current_form == "social_mfa":
-            form_to_show = SocialMFAForm(
-                on_toggle_form=self.set_form,
-                pending_user_id=self.pending_social_user_id,
-                pending_flow_id=self.pending_social_flow_id,
-                pending_binding_digest=self.pending_social_binding_digest,
-            )
-        else:
-            # Fallback to login if something weird happens
-            form_to_show = LoginForm(on_toggle_form=self.set_form)
+        # Decide which form to show, falling back to login if something weird
+        # happens
+        build_form = self._FORM_BUILDERS.get(self.current_form, LoginPage._build_login_form)
+        form_to_show = build_form(self)
 
         content_children: list[rio.Component] = []
         if self.page_message:
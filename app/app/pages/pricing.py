@@ -1,10 +1,71 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
+from dataclasses import field
+import functools
+from types import MappingProxyType
+
 import rio
 from app.components.center_component import CenterComponent
 from app.components.responsive import ResponsiveComponent, WIDTH_COMFORTABLE
 from app.currency import get_currency_config
 
+# Price label templates keyed by whether yearly billing is selected, then by
+# plan.
+_PLAN_PRICE_TEMPLATES: dict[bool, dict[str, str]] = {
+    False: {
+        "sidekick": "29 {plural} / month",
+        "hero": "99 {plural} / month",
+        "supernova": "499 {plural} / month",
+    },
+    True: {
+        "sidekick": "290 {plural} / year (2 months free)",
+        "hero": "990 {plural} / year (2 months free)",
+        "supernova": "4,990 {plural} / year (2 months free)",
+    },
+}
+
+
+# (plan key, title, description, button label) for each card, in display order.
+_PLANS: tuple[tuple[str, str, str, str], ...] = (
+    (
+        "sidekick",
+        "Sidekick Plan",
+        "Ideal for small business heroes in training. "
+        "Includes a single synergy token, a pinch of paradigm-shift, "
+        "and unlimited pep talks via carrier pigeon.",
+        "Conquer the Market",
+    ),
+    (
+        "hero",
+        "Hero Plan",
+        "For the business champion who wants to step up. "
+        "Boasts advanced synergy tokens, mid-range disruption, "
+        "and 24/7 'just-in-time' hyper-support.",
+        "Battle with Innovation",
+    ),
+    (
+        "supernova",
+        "Supernova Plan",
+        "Unleash the pinnacle of synergy with enterprise-grade "
+        "buzzword potential, multi-dimensional disruption, "
+        "and an infinite supply of ninja-level solutions.",
+        "Launch into Orbit",
+    ),
+)
+
+
+@functools.lru_cache(maxsize=8)
+def _plan_prices(currency_plural: str, is_yearly_billing: bool) -> Mapping[str, str]:
+    """Format every plan's price label for a currency and billing cycle."""
+    return MappingProxyType(
+        {
+            plan: template.format(plural=currency_plural)
+            for plan, template in _PLAN_PRICE_TEMPLATES[is_yearly_billing].items()
+        }
+    )
+
+
 class PricingPlans(ResponsiveComponent):
     """
     Pricing page showcasing a whimsical array of plans for potential customers,
@@ -14,6 +75,11 @@ class PricingPlans(ResponsiveComponent):
     # We'll keep track of the selected billing cycle using a boolean
     is_yearly_billing: bool = False
 
+    # Resolved once per component; toggling the billing cycle only rebuilds.
+    _currency_plural: str = field(
+        default_factory=lambda: get_currency_config().name_plural
+    )
+
     def _on_billing_cycle_change(self, event: rio.SwitchChangeEvent) -> None:
         """Handle billing cycle switch changes."""
         self.is_yearly_billing = event.is_on
@@ -23,99 +89,34 @@ class PricingPlans(ResponsiveComponent):
         Build the PricingPage UI with toggling between monthly and yearly pricing.
         """
         # Define the prices depending on the current billing cycle:
-        currency_config = get_currency_config()
-        currency_plural = currency_config.name_plural
-        sidekick_price = (
-            f"290 {currency_plural} / year (2 months free)"
-            if self.is_yearly_billing
-            else f"29 {currency_plural} / month"
-        )
-        hero_price = (
-            f"990 {currency_plural} / year (2 months free)"
-            if self.is_yearly_billing
-            else f"99 {currency_plural} / month"
-        )
-        supernova_price = (
-            f"4,990 {currency_plural} / year (2 months free)"
-            if self.is_yearly_billing
-            else f"499 {currency_plural} / month"
-        )
+        prices = _plan_prices(self._currency_plural, self.is_yearly_billing)
 
         # Build pricing cards
-        sidekick_card = rio.Card(
-            rio.Column(
-                rio.Text(
-                    "Sidekick Plan",
-                    style="heading2",
-                    margin_bottom=1,
-                ),
-                rio.Text(
-                    "Ideal for small business heroes in training. "
-                    "Includes a single synergy token, a pinch of paradigm-shift, "
-                    "and unlimited pep talks via carrier pigeon.",
-                    margin_bottom=1,
-                    overflow="wrap",
-                ),
-                rio.Text(sidekick_price, margin_bottom=2),
-                rio.Button(
-                    "Conquer the Market",
-                    shape="rounded",
-                ),
-                spacing=1,
-                margin=2,
-            ),
-            margin=1,
-        )
-
-        hero_card = rio.Card(
-            rio.Column(
-                rio.Text(
-                    "Hero Plan",
-                    style="heading2",
-                    margin_bottom=1,
-                ),
-                rio.Text(
-                    "For the business champion who wants to step up. "
-                    "Boasts advanced synergy tokens, mid-range disruption, "
-                    "and 24/7 'just-in-time' hyper-support.",
-                    margin_bottom=1,
-                    overflow="wrap",
-                ),
-                rio.Text(hero_price, margin_bottom=2),
-                rio.Button(
-                    "Battle with Innovation",
-                    shape="rounded",
-                ),
-                spacing=1,
-                margin=2,
-            ),
-            margin=1,
-        )
-
-        supernova_card = rio.Card(
-            rio.Column(
-                rio.Text(
-                    "Supernova Plan",
-                    style="heading2",
-                    margin_bottom=1,
-                ),
-                rio.Text(
-                    "Unleash the pinnacle of synergy with enterprise-grade "
-                    "buzzword potential, multi-dimensional disruption, "
-                    "and an infinite supply of ninja-level solutions.",
-                    margin_bottom=1,
-                    overflow="wrap",
-                ),
-                rio.Text(supernova_price, margin_bottom=2),
-                rio.Button(
-                    "Launch into Orbit",
-                    shape="rounded",
+        plan_cards = [
+            rio.Card(
+                rio.Column(
+                    rio.Text(
+                        title,
+                        style="heading2",
+                        margin_bottom=1,
+                    ),
+                    rio.Text(
+                        description,
+                        margin_bottom=1,
+                        overflow="wrap",
+                    ),
+                    rio.Text(prices[plan], margin_bottom=2),
+                    rio.Button(
+                        button_label,
+                        shape="rounded",
+                    ),
+                    spacing=1,
+                    margin=2,
                 ),
-                spacing=1,
-                margin=2,
-            ),
-            margin=1,
-        )
+                margin=1,
+            )
+            for plan, title, description, button_label in _PLANS
+        ]
 
         return CenterComponent(
             rio.Column(
@@ -142,9 +143,7 @@ class PricingPlans(ResponsiveComponent):
 
                 # Use FlowContainer for pricing cards - auto-wraps on mobile
                 rio.FlowContainer(
-                    sidekick_card,
-                    hero_card,
-                    supernova_card,
+                    *plan_cards,
                     row_spacing=2,
                     column_spacing=2,
                     justify="center",
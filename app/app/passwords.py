@@ -3,17 +3,45 @@ from __future__ import annotations
 import hashlib
 import re
 import secrets
+import string
 import unicodedata
 from dataclasses import dataclass
 
 from pwdlib import PasswordHash
+from pwdlib.hashers.argon2 import Argon2Hasher
+
+from app.config import config
 
 
 HASH_SCHEME_ARGON2ID = "argon2id"
 HASH_SCHEME_PBKDF2_SHA256 = "pbkdf2_sha256"
 LEGACY_PBKDF2_ITERATIONS = 100000
 
-_password_hash = PasswordHash.recommended()
+_password_hash = PasswordHash(
+    (
+        Argon2Hasher(
+            time_cost=config.PASSWORD_HASH_TIME_COST,
+            memory_cost=config.PASSWORD_HASH_MEMORY_COST_KIB,
+            parallelism=config.PASSWORD_HASH_PARALLELISM,
+        ),
+    )
+)
+
+_REMOVE_ASCII_UPPERCASE = str.maketrans("", "", string.ascii_uppercase)
+_REMOVE_ASCII_LOWERCASE = str.maketrans("", "", string.ascii_lowercase)
+
+# `\d` and `\W` intentionally keep Unicode semantics so non-ASCII digits and
+# symbols score the same as before; compiling once skips the per-call cache.
+_ASCII_LETTERS_ONLY = re.compile(r"^[a-zA-Z]+$")
+_DIGITS_ONLY = re.compile(r"^\d+$")
+_UPPERCASE_RUN = re.compile(r"[A-Z]{2,}")
+_LOWERCASE_RUN = re.compile(r"[a-z]{2,}")
+_DIGIT_RUN = re.compile(r"\d{2,}")
+_SYMBOL_WINDOW = re.compile(r"[\W_]{3}")
+
+
+def _is_digit_or_symbol(character: str) -> bool:
+    return character.isdecimal() or not character.isalnum()
 
 
 def get_password_strength(
@@ -36,23 +64,33 @@ def get_password_strength(
 
     score += length * 4
 
-    upper_case_letters = re.findall(r"[A-Z]", password)
-    lower_case_letters = re.findall(r"[a-z]", password)
-    numbers = re.findall(r"\d", password)
-    symbols = re.findall(r"[\W_]", password)
+    # Only the class sizes matter, so count with C-level string methods rather
+    # than materialising `re.findall` match lists. `\d` matches Unicode decimal
+    # digits and `[\W_]` anything that is not alphanumeric.
+    upper_case_letters = length - len(password.translate(_REMOVE_ASCII_UPPERCASE))
+    lower_case_letters = length - len(password.translate(_REMOVE_ASCII_LOWERCASE))
+    numbers = sum(map(str.isdecimal, password))
+    symbols = length - sum(map(str.isalnum, password))
 
     if upper_case_letters:
-        score += (length - len(upper_case_letters)) * 2
+        score += (length - upper_case_letters) * 2
     if lower_case_letters:
-        score += (length - len(lower_case_letters)) * 2
+        score += (length - lower_case_letters) * 2
     if numbers:
-        score += len(numbers) * 4
+        score += numbers * 4
     if symbols:
-        score += len(symbols) * 6
+        score += symbols * 6
 
     if length > 2:
-        middle_chars = password[1:-1]
-        score += len(re.findall(r"[\d\W_]", middle_chars)) * 2
+        # Digits and symbols are disjoint classes, so the middle-character
+        # count is the whole-password count minus the two end characters.
+        middle_digits_and_symbols = (
+            numbers
+            + symbols
+            - _is_digit_or_symbol(password[0])
+            - _is_digit_or_symbol(password[-1])
+        )
+        score += middle_digits_and_symbols * 2
 
     requirements = [
         length >= 12,
@@ -65,37 +103,28 @@ def get_password_strength(
     if fulfilled_requirements >= 3:
         score += fulfilled_requirements * 2
 
-    if re.match(r"^[a-zA-Z]+$", password):
+    if _ASCII_LETTERS_ONLY.match(password):
         score -= length
-    if re.match(r"^\d+$", password):
+    if _DIGITS_ONLY.match(password):
         score -= length
 
     score -= len(password) - len(set(password.lower()))
-    score -= len(re.findall(r"[A-Z]{2,}", password)) * 2
-    score -= len(re.findall(r"[a-z]{2,}", password)) * 2
-    score -= len(re.findall(r"\d{2,}", password)) * 2
-
-    score -= sum(
-        1
-        for index in range(len(password) - 2)
-        if password[index : index + 3].isalpha()
-        and ord(password[index + 1]) == ord(password[index]) + 1
-        and ord(password[index + 2]) == ord(password[index]) + 2
-    ) * 3
-    score -= sum(
-        1
-        for index in range(len(password) - 2)
-        if password[index : index + 3].isdigit()
-        and ord(password[index + 1]) == ord(password[index]) + 1
-        and ord(password[index + 2]) == ord(password[index]) + 2
-    ) * 3
-    score -= sum(
-        1
-        for index in range(len(password) - 2)
-        if re.match(r"[\W_]{3}", password[index : index + 3])
-        and ord(password[index + 1]) == ord(password[index]) + 1
-        and ord(password[index + 2]) == ord(password[index]) + 2
-    ) * 3
+    score -= len(_UPPERCASE_RUN.findall(password)) * 2
+    score -= len(_LOWERCASE_RUN.findall(password)) * 2
+    score -= len(_DIGIT_RUN.findall(password)) * 2
+
+    # Compare code points once up front and only inspect the character class
+    # of the rare windows that actually step by one.
+    code_points = [ord(character) for character in password]
+    sequential_runs = 0
+    for index in range(length - 2):
+        first = code_points[index]
+        if code_points[index + 1] != first + 1 or code_points[index + 2] != first + 2:
+            continue
+        window = password[index : index + 3]
+        if window.isalpha() or window.isdigit() or _SYMBOL_WINDOW.match(window):
+            sequential_runs += 1
+    score -= sequential_runs * 3
 
     score = max(0, min(score, 99))
     meaningful_password = password.strip()
@@ -31,8 +31,27 @@ ROLE_HIERARCHY = {
     "user": 3
 }
 
+# The extremes of the hierarchy are fixed for the process lifetime.
+_HIGHEST_PRIVILEGE_ROLE = min(ROLE_HIERARCHY, key=ROLE_HIERARCHY.__getitem__)
+_DEFAULT_ROLE = max(ROLE_HIERARCHY, key=ROLE_HIERARCHY.__getitem__)
+
 PAGE_ROLE_MAPPING = get_page_role_mapping()
 
+# Pages open to every role ("*"), including roles missing from ROLE_HIERARCHY.
+_PUBLIC_PAGES = frozenset(
+    page for page, roles in PAGE_ROLE_MAPPING.items() if "*" in roles
+)
+
+# Every (page, role) decision for the registered pages and known roles, so
+# check_access is a single lookup. The highest-privilege role is answered by
+# check_access before the lookup and therefore has no entries here.
+_ACCESS_TABLE = {
+    (page, role): "*" in roles or role in roles
+    for page, roles in PAGE_ROLE_MAPPING.items()
+    for role in ROLE_HIERARCHY
+    if role != _HIGHEST_PRIVILEGE_ROLE
+}
+
 def get_role_level(role: str) -> int:
     """Get the hierarchy level of a role"""
     level = ROLE_HIERARCHY.get(role)
@@ -61,15 +80,13 @@ def check_access(current_page: str, user_role: str) -> bool:
         bool: True if the user has access, False otherwise
     """
     # Highest privilege role has access to all pages
-    if user_role == get_highest_privilege_role():
+    if user_role == _HIGHEST_PRIVILEGE_ROLE:
         return True
 
-    if current_page in PAGE_ROLE_MAPPING:
-        allowed_roles = PAGE_ROLE_MAPPING[current_page]
-        if "*" in allowed_roles:
-            return True
-        return user_role in allowed_roles
-    return False
+    return _ACCESS_TABLE.get(
+        (current_page, user_role),
+        current_page in _PUBLIC_PAGES,
+    )
 
 def get_all_roles() -> list[str]:
     """
@@ -88,7 +105,7 @@ def get_default_role() -> str:
     Returns:
         str: The default role name
     """
-    return max(ROLE_HIERARCHY.items(), key=lambda x: x[1])[0]
+    return _DEFAULT_ROLE
 
 def get_highest_privilege_role() -> str:
     """
@@ -98,7 +115,7 @@ def get_highest_privilege_role() -> str:
     Returns:
         str: The highest privilege role name
     """
-    return min(ROLE_HIERARCHY.items(), key=lambda x: x[1])[0]
+    return _HIGHEST_PRIVILEGE_ROLE
 
 def validate_role(role: str) -> bool:
     """
@@ -1,9 +1,12 @@
+import asyncio
+import logging
 import sqlite3
 import threading
+import time
 import uuid
 import typing as t
 from dataclasses import dataclass
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timedelta
 from pathlib import Path
 
 from app.data_models import (
@@ -38,6 +41,8 @@ import app.persistence_users as persistence_users
 from app.persistence_schema import initialize_schema
 
 
+logger = logging.getLogger(__name__)
+
 DEFAULT_DB_PATH = Path(__file__).resolve().parent / "data" / "app.db"
 TwoFactorStateConflict = persistence_auth.TwoFactorStateConflict
 PasswordChangeSessionInvalidError = (
@@ -87,6 +92,14 @@ class _AdminTargetSnapshot:
     primary_currency_balance: int
 
 
+# The persistence modules issue a few hundred distinct statements; sqlite3's
+# default per-connection statement cache of 128 would keep evicting them. The
+# facade attached in on_app_start is shared by every Rio session and keeps one
+# connection per worker thread for the life of the process, so that is where the
+# cache pays off; per-request API connections fill it lazily and lose nothing.
+_STATEMENT_CACHE_SIZE = 512
+
+
 # Schema setup is idempotent but does ~29 DDL statements, so we only run it once
 # per database file per process instead of on every Persistence() construction
 # (the FastAPI dependency builds a fresh facade on each request). The guard is an
@@ -148,18 +161,48 @@ class Persistence:
 
     def _ensure_connection(self) -> None:
         if self.conn is None:
-            self.conn = sqlite3.connect(self.db_path, timeout=30.0)
+            self.conn = sqlite3.connect(
+                self.db_path,
+                timeout=30.0,
+                cached_statements=_STATEMENT_CACHE_SIZE,
+            )
             self.conn.execute("PRAGMA foreign_keys = ON")
             self.conn.execute("PRAGMA busy_timeout = 5000")
+            # The database runs in WAL mode (see initialize_schema), where
+            # NORMAL stays corruption-safe and skips the per-commit WAL fsync.
+            self.conn.execute("PRAGMA synchronous = NORMAL")
+            # Keep the remaining ORDER BY sorts and temp B-trees off disk.
+            self.conn.execute("PRAGMA temp_store = MEMORY")
 
     def _get_cursor(self):
         self._ensure_connection()
         return self.conn.cursor()
 
+    def optimize(self) -> None:
+        """
+        Refresh SQLite planner statistics on the calling thread's connection.
+
+        Only that one connection is touched; connections other threads hold on
+        a shared facade are not. Does nothing if this thread never opened a
+        connection, since PRAGMA optimize works from the queries a connection
+        has run. The analysis limit keeps any ANALYZE it triggers bounded.
+        A busy or locked database is logged and skipped rather than raised.
+        """
+        if self.conn is None:
+            return
+        try:
+            self.conn.execute("PRAGMA analysis_limit = 400")
+            self.conn.execute("PRAGMA optimize")
+        except sqlite3.OperationalError:
+            logger.warning("Skipped PRAGMA optimize on %s", self.db_path, exc_info=True)
+
     def close(self) -> None:
-        # As of the post-a179c6c persistence fix, repo usage is request/session
-        # scoped and does not share one facade across long-lived worker threads.
-        # If that changes, each worker thread must close its own connection.
+        # Closes only the calling thread's connection. The Rio facade attached in
+        # on_app_start is shared across sessions and worker threads for the life
+        # of the process; on_app_close closes the shutdown thread's connection,
+        # and the others are released with their threads (or with the facade's
+        # thread-local storage). Per-request API and script facades are closed
+        # by their owner on the thread that used them.
         if not self.conn:
             return
         try:
@@ -536,7 +579,7 @@ class Persistence:
         conn = self.conn
         self._require_top_level_transaction(conn, action="User creation")
         cursor = conn.cursor()
-        now_ts = datetime.now(timezone.utc).timestamp()
+        now_ts = time.time()
 
         try:
             conn.execute("BEGIN IMMEDIATE")
@@ -598,7 +641,10 @@ class Persistence:
                 username=sanitized_username,
             ),
         )
-        user = AppUser.create_new_user_with_default_settings(
+        # Password hashing is deliberately slow; run it on a worker thread so
+        # the event loop keeps serving other sessions during sign-up bursts.
+        user = await asyncio.to_thread(
+            AppUser.create_new_user_with_default_settings,
             email=normalized_email,
             password=password,
             username=sanitized_username,
@@ -668,7 +714,9 @@ class Persistence:
             ),
         )
 
-        user = AppUser.create_new_user_with_default_settings(
+        # Hash before taking the writer lock; nothing awaits inside it.
+        user = await asyncio.to_thread(
+            AppUser.create_new_user_with_default_settings,
             email=normalized_email,
             password=password,
             username=sanitized_username,
@@ -693,7 +741,7 @@ class Persistence:
                 target_role=role,
                 action="create",
             )
-            now_ts = datetime.now(timezone.utc).timestamp()
+            now_ts = time.time()
             self._insert_user_records(
                 cursor,
                 user=user,
@@ -791,7 +839,7 @@ class Persistence:
                 normalized_email is not None
                 and normalized_email != target.email
             )
-            now_ts = datetime.now(timezone.utc).timestamp()
+            now_ts = time.time()
             user_fields: list[str] = []
             user_params: list[t.Any] = []
             if normalized_email is not None:
@@ -1093,13 +1141,13 @@ class Persistence:
         conn = self.conn
         self._require_top_level_transaction(conn, action="Root bootstrap")
         cursor = conn.cursor()
-        now_ts = datetime.now(timezone.utc).timestamp()
+        now_ts = time.time()
         root_role = get_highest_privilege_role()
 
         try:
             conn.execute("BEGIN IMMEDIATE")
-            cursor.execute("SELECT COUNT(*) FROM users")
-            if cursor.fetchone()[0] > 0:
+            cursor.execute("SELECT 1 FROM users LIMIT 1")
+            if cursor.fetchone() is not None:
                 conn.rollback()
                 return False
 
@@ -1117,6 +1165,9 @@ class Persistence:
             conn.rollback()
             raise
 
+    async def email_exists(self, email: str) -> bool:
+        return await persistence_users.email_exists(self, email)
+
     async def get_user_by_email(self, email: str) -> AppUser:
         return await persistence_users.get_user_by_email(self, email)
 
@@ -2135,7 +2186,7 @@ class Persistence:
         conn = self.conn
         self._require_top_level_transaction(conn, action="Profile creation")
         cursor = conn.cursor()
-        now_ts = datetime.now(timezone.utc).timestamp()
+        now_ts = time.time()
 
         try:
             conn.execute("BEGIN IMMEDIATE")
@@ -2280,11 +2331,11 @@ class Persistence:
                 ORDER BY p.created_at DESC
                 """
             )
-            rows = cursor.fetchall()
+            actor_id = str(actor.id)
             visible_rows = [
                 row
-                for row in rows
-                if str(actor.id) == str(row[1])
+                for row in cursor
+                if actor_id == str(row[1])
                 or can_manage_role(actor.role, t.cast(str, row[10]))
             ]
             conn.commit()
@@ -2354,7 +2405,7 @@ class Persistence:
             if fields:
                 fields.append("updated_at = ?")
                 params.extend(
-                    [datetime.now(timezone.utc).timestamp(), canonical_user_id]
+                    [time.time(), canonical_user_id]
                 )
                 cursor.execute(
                     f"UPDATE profiles SET {', '.join(fields)} WHERE user_id = ?",
@@ -13,6 +13,7 @@ are exposed here: the log is append-only by convention.
 
 import json
 import sqlite3
+import time
 import typing as t
 import uuid
 from datetime import datetime, timezone
@@ -90,7 +91,7 @@ def record_admin_action(
     ``commit=True``.
     """
     cursor = persistence._get_cursor()
-    timestamp = created_at or datetime.now(timezone.utc).timestamp()
+    timestamp = created_at or time.time()
     cursor.execute(
         """
         INSERT INTO admin_audit_log (
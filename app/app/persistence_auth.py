@@ -1,6 +1,9 @@
+import asyncio
 import hashlib
 import secrets
 import sqlite3
+import string
+import time
 import typing as t
 import uuid
 from dataclasses import dataclass
@@ -114,13 +117,17 @@ def _generate_recovery_code() -> str:
     return "-".join(raw[i : i + 4] for i in range(0, 12, 4))
 
 
+# Hyphens and any whitespace pasted around or inside a code carry no meaning.
+_RECOVERY_CODE_SEPARATORS = str.maketrans("", "", "-" + string.whitespace)
+
+
 def _normalize_recovery_code(code: str | None) -> str:
     """
     Normalize a recovery code for hashing/verification.
     """
     if not code:
         return ""
-    return "".join(part.strip() for part in code.upper().split("-"))
+    return code.upper().translate(_RECOVERY_CODE_SEPARATORS)
 
 
 def _hash_one_time_token(token: str) -> str:
@@ -130,6 +137,16 @@ def _hash_one_time_token(token: str) -> str:
     return hashlib.sha256(token.encode("utf-8")).hexdigest()
 
 
+def _verify_totp_code(secret: str, code: str) -> bool:
+    """
+    Check a normalized code against the current TOTP step only. Input that is
+    not a code of the configured length is rejected without computing the
+    HMAC; pyotp compares the rest in constant time.
+    """
+    totp = pyotp.TOTP(secret)
+    return len(code) == totp.digits and code.isdigit() and totp.verify(code)
+
+
 def _replace_recovery_codes(
     cursor: sqlite3.Cursor,
     user_id: uuid.UUID,
@@ -142,28 +159,27 @@ def _replace_recovery_codes(
         (normalized_user_id,),
     )
 
-    new_codes: list[str] = []
-    for _ in range(count):
-        code = _generate_recovery_code()
-        normalized_code = _normalize_recovery_code(code)
-        created_at = datetime.now(timezone.utc)
-        valid_until = created_at + timedelta(days=config.RECOVERY_CODE_TTL_DAYS)
-        code_hash = _hash_one_time_token(normalized_code)
-
-        cursor.execute(
-            """
-            INSERT INTO two_factor_recovery_codes (
-                user_id, code_hash, created_at, valid_until, used_at
-            ) VALUES (?, ?, ?, ?, NULL)
-            """,
+    created_ts = time.time()
+    valid_until_ts = (
+        created_ts + timedelta(days=config.RECOVERY_CODE_TTL_DAYS).total_seconds()
+    )
+    new_codes = [_generate_recovery_code() for _ in range(count)]
+    cursor.executemany(
+        """
+        INSERT INTO two_factor_recovery_codes (
+            user_id, code_hash, created_at, valid_until, used_at
+        ) VALUES (?, ?, ?, ?, NULL)
+        """,
+        [
             (
                 normalized_user_id,
-                code_hash,
-                created_at.timestamp(),
-                valid_until.timestamp(),
-            ),
-        )
-        new_codes.append(code)
+                _hash_one_time_token(_normalize_recovery_code(code)),
+                created_ts,
+                valid_until_ts,
+            )
+            for code in new_codes
+        ],
+    )
 
     return new_codes
 
@@ -298,6 +314,7 @@ def enroll_two_factor_in_transaction(
         raise RuntimeError("MFA enrollment requires an open transaction.")
 
     cursor = persistence._get_cursor()
+    uid = str(user_id)
     _require_verified_email_for_enrollment(cursor, user_id)
     cursor.execute(
         """
@@ -306,10 +323,10 @@ def enroll_two_factor_in_transaction(
         WHERE id = ?
           AND (two_factor_secret IS NULL OR two_factor_secret = '')
         """,
-        (normalized_secret, str(user_id)),
+        (normalized_secret, uid),
     )
     if cursor.rowcount != 1:
-        cursor.execute("SELECT 1 FROM users WHERE id = ?", (str(user_id),))
+        cursor.execute("SELECT 1 FROM users WHERE id = ?", (uid,))
         if cursor.fetchone() is None:
             raise KeyError(user_id)
         raise TwoFactorStateConflict("Two-factor authentication is already enabled.")
@@ -348,7 +365,7 @@ def verify_two_factor_candidate(
         )
 
     normalized_code = sanitized_code.replace("-", "")
-    if normalized_code.isdigit() and pyotp.TOTP(normalized_secret).verify(normalized_code):
+    if _verify_totp_code(normalized_secret, normalized_code):
         return TwoFactorChallengeResult(ok=True, method=TwoFactorMethod.TOTP)
 
     return TwoFactorChallengeResult(
@@ -367,6 +384,7 @@ def invalidate_recovery_codes(
     """Remove all recovery codes for a user."""
     conn = _get_connection(persistence)
     cursor = persistence._get_cursor()
+    uid = str(user_id)
     if commit:
         _require_top_level_transaction(
             conn,
@@ -376,7 +394,7 @@ def invalidate_recovery_codes(
             conn.execute("BEGIN IMMEDIATE")
             cursor.execute(
                 "DELETE FROM two_factor_recovery_codes WHERE user_id = ?",
-                (str(user_id),),
+                (uid,),
             )
             conn.commit()
         except Exception:
@@ -391,7 +409,7 @@ def invalidate_recovery_codes(
         )
     cursor.execute(
         "DELETE FROM two_factor_recovery_codes WHERE user_id = ?",
-        (str(user_id),),
+        (uid,),
     )
 
 
@@ -407,33 +425,27 @@ def _consume_recovery_code_in_transaction(
     if not normalized_code:
         return False
 
+    # Codes are stored as unsalted digests, so the match and the single-use
+    # check-and-set can both happen in one statement.
     cursor = persistence._get_cursor()
-    now_ts = datetime.now(timezone.utc).timestamp()
+    now_ts = time.time()
     cursor.execute(
         """
-        SELECT id, code_hash
-        FROM two_factor_recovery_codes
-        WHERE user_id = ? AND used_at IS NULL AND valid_until > ?
+        UPDATE two_factor_recovery_codes
+        SET used_at = ?
+        WHERE user_id = ?
+          AND code_hash = ?
+          AND used_at IS NULL
+          AND valid_until > ?
         """,
-        (str(user_id), now_ts),
+        (
+            now_ts,
+            str(user_id),
+            _hash_one_time_token(normalized_code),
+            now_ts,
+        ),
     )
-
-    candidate_hash = _hash_one_time_token(normalized_code)
-    for code_id, stored_hash in cursor.fetchall():
-        if not secrets.compare_digest(stored_hash, candidate_hash):
-            continue
-
-        cursor.execute(
-            """
-            UPDATE two_factor_recovery_codes
-            SET used_at = ?
-            WHERE id = ? AND used_at IS NULL AND valid_until > ?
-            """,
-            (now_ts, code_id, now_ts),
-        )
-        return cursor.rowcount == 1
-
-    return False
+    return cursor.rowcount > 0
 
 
 def consume_recovery_code(
@@ -515,25 +527,26 @@ def get_recovery_codes_summary(
     """
     Provide aggregate information about a user's recovery codes.
     """
-    metadata = get_recovery_codes_metadata(persistence, user_id)
-    if not metadata:
-        return {
-            "total": 0,
-            "used": 0,
-            "remaining": 0,
-            "last_generated": None,
-        }
-
-    total = len(metadata)
-    used = sum(1 for record in metadata if record.used_at is not None)
-    remaining = total - used
-    last_generated = max(record.created_at for record in metadata)
+    cursor = persistence._get_cursor()
+    cursor.execute(
+        """
+        SELECT COUNT(*), COUNT(used_at), MAX(created_at)
+        FROM two_factor_recovery_codes
+        WHERE user_id = ?
+        """,
+        (str(user_id),),
+    )
+    total, used, last_generated_ts = cursor.fetchone()
 
     return {
         "total": total,
         "used": used,
-        "remaining": remaining,
-        "last_generated": last_generated,
+        "remaining": total - used,
+        "last_generated": (
+            datetime.fromtimestamp(last_generated_ts, tz=timezone.utc)
+            if last_generated_ts is not None
+            else None
+        ),
     }
 
 
@@ -669,7 +682,7 @@ async def get_session_by_auth_token(
     """
     cursor = persistence._get_cursor()
     cursor.execute(
-        "SELECT id, user_id, created_at, valid_until, role FROM user_sessions WHERE id = ? ORDER BY created_at LIMIT 1",
+        "SELECT id, user_id, created_at, valid_until, role FROM user_sessions WHERE id = ?",
         (_hash_one_time_token(auth_token),),
     )
 
@@ -708,8 +721,6 @@ def _get_valid_session_by_auth_token(
         FROM user_sessions AS s
         JOIN users AS u ON u.id = s.user_id
         WHERE s.id = ?
-        ORDER BY s.created_at
-        LIMIT 1
         """,
         (_hash_one_time_token(auth_token),),
     )
@@ -885,10 +896,8 @@ def _verify_two_factor_challenge(
         )
 
     normalized = sanitized_code.replace("-", "")
-    if normalized.isdigit():
-        totp = pyotp.TOTP(secret)
-        if totp.verify(normalized):
-            return TwoFactorChallengeResult(ok=True, method=TwoFactorMethod.TOTP)
+    if _verify_totp_code(secret, normalized):
+        return TwoFactorChallengeResult(ok=True, method=TwoFactorMethod.TOTP)
 
     if recovery_code_consumer is not None and recovery_code_consumer(
         user_id,
@@ -996,6 +1005,7 @@ def set_2fa_secret(
     """
     conn = _get_connection(persistence)
     cursor = persistence._get_cursor()
+    uid = str(user_id)
 
     if secret is not None:
         secret = secret.strip()
@@ -1009,13 +1019,13 @@ def set_2fa_secret(
         if secret is None:
             cursor.execute(
                 "UPDATE users SET two_factor_secret = NULL WHERE id = ?",
-                (str(user_id),),
+                (uid,),
             )
             if cursor.rowcount != 1:
                 raise KeyError(user_id)
             cursor.execute(
                 "DELETE FROM two_factor_recovery_codes WHERE user_id = ?",
-                (str(user_id),),
+                (uid,),
             )
         else:
             _require_verified_email_for_enrollment(cursor, user_id)
@@ -1026,7 +1036,7 @@ def set_2fa_secret(
                 WHERE id = ?
                   AND (two_factor_secret IS NULL OR two_factor_secret = '')
                 """,
-                (secret, str(user_id)),
+                (secret, uid),
             )
             if cursor.rowcount == 1:
                 # Pre-fix failures could leave recovery rows behind while MFA was
@@ -1034,12 +1044,12 @@ def set_2fa_secret(
                 # factor.
                 cursor.execute(
                     "DELETE FROM two_factor_recovery_codes WHERE user_id = ?",
-                    (str(user_id),),
+                    (uid,),
                 )
             else:
                 cursor.execute(
                     "SELECT two_factor_secret FROM users WHERE id = ?",
-                    (str(user_id),),
+                    (uid,),
                 )
                 row = cursor.fetchone()
                 if row is None:
@@ -1096,23 +1106,24 @@ def disable_two_factor_in_transaction(
         raise RuntimeError("MFA disable requires an open transaction.")
 
     cursor = persistence._get_cursor()
+    uid = str(user_id)
     cursor.execute(
         """
         UPDATE users
         SET two_factor_secret = NULL
         WHERE id = ? AND two_factor_secret = ?
         """,
-        (str(user_id), expected_secret),
+        (uid, expected_secret),
     )
     if cursor.rowcount != 1:
-        cursor.execute("SELECT 1 FROM users WHERE id = ?", (str(user_id),))
+        cursor.execute("SELECT 1 FROM users WHERE id = ?", (uid,))
         if cursor.fetchone() is None:
             raise KeyError(user_id)
         return False
 
     cursor.execute(
         "DELETE FROM two_factor_recovery_codes WHERE user_id = ?",
-        (str(user_id),),
+        (uid,),
     )
     return True
 
@@ -1178,8 +1189,12 @@ async def update_password(
         new_password,
         acknowledged_weak=acknowledged_weak,
     )
-    password_hash, password_salt, password_scheme = password_utils.hash_password(new_password)
+    password_hash, password_salt, password_scheme = await asyncio.to_thread(
+        password_utils.hash_password,
+        new_password,
+    )
     cursor = persistence._get_cursor()
+    uid = str(user_id)
 
     try:
         conn.execute("BEGIN IMMEDIATE")
@@ -1189,7 +1204,7 @@ async def update_password(
             FROM users
             WHERE id = ?
             """,
-            (str(user_id),),
+            (uid,),
         )
         user_row = cursor.fetchone()
         if user_row is None:
@@ -1217,18 +1232,18 @@ async def update_password(
             SET password_hash = ?, password_salt = ?, password_scheme = ?
             WHERE id = ?
             """,
-            (password_hash, password_salt, password_scheme, str(user_id)),
+            (password_hash, password_salt, password_scheme, uid),
         )
         if cursor.rowcount == 0:
             raise KeyError(user_id)
 
         cursor.execute(
             "DELETE FROM password_reset_tokens WHERE user_id = ?",
-            (str(user_id),),
+            (uid,),
         )
         cursor.execute(
             "DELETE FROM user_sessions WHERE user_id = ?",
-            (str(user_id),),
+            (uid,),
         )
         conn.commit()
     except Exception:
@@ -1266,7 +1281,7 @@ async def change_password_for_session(
         )
     if preflight_user.auth_provider != "password":
         raise ValueError("External-auth users do not have a local password.")
-    if not preflight_user.verify_password(current_password):
+    if not await asyncio.to_thread(preflight_user.verify_password, current_password):
         raise PasswordChangeCurrentPasswordError(
             "Current password is incorrect"
         )
@@ -1289,8 +1304,9 @@ async def change_password_for_session(
             username=preflight_user.username,
         ),
     )
-    password_hash, password_salt, password_scheme = password_utils.hash_password(
-        new_password
+    password_hash, password_salt, password_scheme = await asyncio.to_thread(
+        password_utils.hash_password,
+        new_password,
     )
     cursor = persistence._get_cursor()
 
@@ -1382,16 +1398,20 @@ async def upgrade_user_password_hash(
 ) -> AppUser:
     conn = _get_connection(persistence)
     cursor = persistence._get_cursor()
+    uid = str(user_id)
 
     current_user = await persistence.get_user_by_id(user_id)
-    result = current_user.verify_password_result(password)
+    result = await asyncio.to_thread(current_user.verify_password_result, password)
     if not result.ok:
         raise ValueError("Password verification failed during hash upgrade")
     if not result.needs_rehash:
         return current_user
 
     _require_top_level_transaction(conn, operation="Password hash upgrade")
-    password_hash, password_salt, password_scheme = password_utils.hash_password(password)
+    password_hash, password_salt, password_scheme = await asyncio.to_thread(
+        password_utils.hash_password,
+        password,
+    )
 
     try:
         conn.execute("BEGIN IMMEDIATE")
@@ -1402,7 +1422,7 @@ async def upgrade_user_password_hash(
             WHERE id = ?
             LIMIT 1
             """,
-            (str(user_id),),
+            (uid,),
         )
         row = cursor.fetchone()
         if row is None:
@@ -1422,7 +1442,7 @@ async def upgrade_user_password_hash(
             SET password_hash = ?, password_salt = ?, password_scheme = ?
             WHERE id = ?
             """,
-            (password_hash, password_salt, password_scheme, str(user_id)),
+            (password_hash, password_salt, password_scheme, uid),
         )
         conn.commit()
     except Exception:
@@ -1452,6 +1472,7 @@ async def consume_reset_token_and_update_password(
     )
     token_hash = _hash_one_time_token(token)
     cursor = persistence._get_cursor()
+    uid = str(user_id)
 
     # Avoid an Argon2 hash for a wholly missing token. This read is only an
     # optimization; ownership, expiry, and account state are authoritative only
@@ -1514,7 +1535,10 @@ async def consume_reset_token_and_update_password(
                 conn.rollback()
             raise
 
-    password_hash, password_salt, password_scheme = password_utils.hash_password(new_password)
+    password_hash, password_salt, password_scheme = await asyncio.to_thread(
+        password_utils.hash_password,
+        new_password,
+    )
 
     try:
         conn.execute("BEGIN IMMEDIATE")
@@ -1547,7 +1571,7 @@ async def consume_reset_token_and_update_password(
             FROM users
             WHERE id = ?
             """,
-            (str(user_id),),
+            (uid,),
         )
         user_row = cursor.fetchone()
         if (
@@ -1580,18 +1604,18 @@ async def consume_reset_token_and_update_password(
             SET password_hash = ?, password_salt = ?, password_scheme = ?
             WHERE id = ?
             """,
-            (password_hash, password_salt, password_scheme, str(user_id)),
+            (password_hash, password_salt, password_scheme, uid),
         )
         if cursor.rowcount == 0:
             raise KeyError(user_id)
 
         cursor.execute(
             "DELETE FROM password_reset_tokens WHERE user_id = ?",
-            (str(user_id),),
+            (uid,),
         )
         cursor.execute(
             "DELETE FROM user_sessions WHERE user_id = ?",
-            (str(user_id),),
+            (uid,),
         )
         conn.commit()
         return True
@@ -1616,14 +1640,17 @@ def create_reset_token_in_transaction(
     )
     hashed_token = _hash_one_time_token(reset_token.token)
     cursor = persistence._get_cursor()
-    cursor.execute(
-        "DELETE FROM password_reset_tokens WHERE user_id = ?",
-        (str(user_id),),
-    )
+    # idx_password_reset_tokens_user_id keeps one row per user, so the new
+    # token replaces any outstanding one in a single statement.
     cursor.execute(
         """
         INSERT INTO password_reset_tokens (token_hash, user_id, created_at, valid_until)
         VALUES (?, ?, ?, ?)
+        ON CONFLICT(user_id)
+        DO UPDATE SET
+            token_hash = excluded.token_hash,
+            created_at = excluded.created_at,
+            valid_until = excluded.valid_until
         """,
         (
             hashed_token,
@@ -1816,6 +1843,7 @@ async def create_email_verification_token(
         operation="Email verification token issuance",
     )
     cursor = persistence._get_cursor()
+    uid = str(user_id)
     token = ExpirableVerificationToken.create(
         user_id=user_id,
         valid_for=timedelta(minutes=config.EMAIL_VERIFICATION_TOKEN_TTL_MINUTES),
@@ -1826,14 +1854,14 @@ async def create_email_verification_token(
         conn.execute("BEGIN IMMEDIATE")
         cursor.execute(
             "SELECT 1 FROM users WHERE id = ?",
-            (str(user_id),),
+            (uid,),
         )
         if cursor.fetchone() is None:
             raise KeyError(user_id)
 
         cursor.execute(
             "DELETE FROM email_verification_tokens WHERE user_id = ?",
-            (str(user_id),),
+            (uid,),
         )
         cursor.execute(
             """
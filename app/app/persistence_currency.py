@@ -1,6 +1,7 @@
 import json
 import secrets
 import sqlite3
+import time
 import typing as t
 import uuid
 from datetime import datetime, timezone
@@ -38,18 +39,25 @@ def _get_connection(persistence: CurrencyPersistence) -> sqlite3.Connection:
 
 def _row_to_currency_ledger_entry(row: tuple) -> CurrencyLedgerEntry:
     """Convert a ledger row tuple into a dataclass instance."""
-    metadata_json = row[5]
-    metadata = json.loads(metadata_json) if metadata_json else None
-    actor_id = uuid.UUID(row[6]) if row[6] else None
+    (
+        entry_id,
+        user_id,
+        delta,
+        balance_after,
+        reason,
+        metadata_json,
+        actor_user_id,
+        created_at_ts,
+    ) = row
     return CurrencyLedgerEntry(
-        id=row[0],
-        user_id=uuid.UUID(row[1]),
-        delta=int(row[2]),
-        balance_after=int(row[3]),
-        reason=row[4],
-        metadata=metadata,
-        actor_user_id=actor_id,
-        created_at=datetime.fromtimestamp(row[7], tz=timezone.utc),
+        id=entry_id,
+        user_id=uuid.UUID(user_id),
+        delta=int(delta),
+        balance_after=int(balance_after),
+        reason=reason,
+        metadata=json.loads(metadata_json) if metadata_json else None,
+        actor_user_id=uuid.UUID(actor_user_id) if actor_user_id else None,
+        created_at=datetime.fromtimestamp(created_at_ts, tz=timezone.utc),
     )
 
 
@@ -125,7 +133,7 @@ def record_currency_idempotency_result(
             str(idempotency_key),
             request_fingerprint,
             int(ledger_entry_id),
-            datetime.now(timezone.utc).timestamp(),
+            time.time(),
         ),
     )
 
@@ -164,7 +172,7 @@ def append_currency_ledger_entry(
     Internal helper to insert a row into the currency ledger table.
     """
     cursor = persistence._get_cursor()
-    timestamp = created_at or datetime.now(timezone.utc).timestamp()
+    timestamp = created_at or time.time()
     metadata_json = json.dumps(metadata) if metadata is not None else None
     cursor.execute(
         """
@@ -209,8 +217,15 @@ async def get_currency_balance(
     user_id: uuid.UUID,
 ) -> int:
     """Return the raw minor-unit balance for a user."""
-    overview = await get_currency_overview(persistence, user_id)
-    return overview["balance_minor"]
+    cursor = persistence._get_cursor()
+    cursor.execute(
+        "SELECT primary_currency_balance FROM users WHERE id = ? LIMIT 1",
+        (str(user_id),),
+    )
+    row = cursor.fetchone()
+    if not row:
+        raise KeyError(user_id)
+    return int(row[0]) if row[0] is not None else 0
 
 
 async def get_currency_overview(
@@ -272,13 +287,14 @@ def adjust_currency_balance_in_transaction(
         raise ValueError("Currency adjustment must be non-zero in minor units")
     cfg = get_currency_config()
     cursor = persistence._get_cursor()
+    uid = str(user_id)
 
     if metadata is not None and not isinstance(metadata, dict):
         raise ValueError("metadata must be a mapping if provided")
 
     cursor.execute(
         "SELECT primary_currency_balance FROM users WHERE id = ?",
-        (str(user_id),),
+        (uid,),
     )
     row = cursor.fetchone()
     if not row:
@@ -290,14 +306,14 @@ def adjust_currency_balance_in_transaction(
     if not cfg.allow_negative and new_balance < 0:
         raise ValueError("Currency balance cannot be negative")
 
-    timestamp = datetime.now(timezone.utc).timestamp()
+    timestamp = time.time()
     cursor.execute(
         """
         UPDATE users
         SET primary_currency_balance = ?, primary_currency_updated_at = ?
         WHERE id = ?
         """,
-        (new_balance, timestamp, str(user_id)),
+        (new_balance, timestamp, uid),
     )
 
     ledger_entry = append_currency_ledger_entry(
@@ -351,9 +367,10 @@ def set_currency_balance_in_transaction(
         raise ValueError("Currency balance cannot be negative")
 
     cursor = persistence._get_cursor()
+    uid = str(user_id)
     cursor.execute(
         "SELECT primary_currency_balance FROM users WHERE id = ?",
-        (str(user_id),),
+        (uid,),
     )
     row = cursor.fetchone()
     if not row:
@@ -362,14 +379,14 @@ def set_currency_balance_in_transaction(
     current_balance = int(row[0] or 0)
     delta = int(new_balance_minor) - current_balance
 
-    timestamp = datetime.now(timezone.utc).timestamp()
+    timestamp = time.time()
     cursor.execute(
         """
         UPDATE users
         SET primary_currency_balance = ?, primary_currency_updated_at = ?
         WHERE id = ?
         """,
-        (int(new_balance_minor), timestamp, str(user_id)),
+        (int(new_balance_minor), timestamp, uid),
     )
 
     ledger_entry = append_currency_ledger_entry(
@@ -504,8 +521,7 @@ async def list_currency_ledger(
     params.append(max(1, min(limit, 500)))
 
     cursor.execute(query, params)
-    rows = cursor.fetchall()
-    return [_row_to_currency_ledger_entry(row) for row in rows]
+    return [_row_to_currency_ledger_entry(row) for row in cursor]
 
 
 async def verify_currency_balance(
@@ -517,6 +533,7 @@ async def verify_currency_balance(
     """Compare one user's stored currency balance against ledger deltas."""
     conn = _get_connection(persistence)
     cursor = persistence._get_cursor()
+    uid = str(user_id)
     owns_transaction = auto_fix and not conn.in_transaction
 
     try:
@@ -534,7 +551,7 @@ async def verify_currency_balance(
             WHERE users.id = ?
             GROUP BY users.id, users.primary_currency_balance
             """,
-            (str(user_id),),
+            (uid,),
         )
         row = cursor.fetchone()
         if not row:
@@ -555,8 +572,8 @@ async def verify_currency_balance(
                 """,
                 (
                     ledger_balance,
-                    datetime.now(timezone.utc).timestamp(),
-                    str(user_id),
+                    time.time(),
+                    uid,
                 ),
             )
             fixed = True
@@ -607,7 +624,7 @@ async def verify_all_balances(
 
         details: list[dict[str, t.Any]] = []
         updates: list[tuple[int, float, str]] = []
-        timestamp = datetime.now(timezone.utc).timestamp()
+        timestamp = time.time()
 
         for row in rows:
             user_id = uuid.UUID(row[0])
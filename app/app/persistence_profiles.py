@@ -1,6 +1,6 @@
 import sqlite3
+import time
 import typing as t
-from datetime import datetime, timezone
 from typing import Protocol
 
 
@@ -23,17 +23,29 @@ def _get_connection(persistence: ProfilesPersistence) -> sqlite3.Connection:
 
 def _row_to_profile(row: tuple) -> dict[str, t.Any]:
     """Convert a database row into a serializable profile dict."""
+    (
+        profile_id,
+        user_id,
+        full_name,
+        email,
+        phone,
+        address,
+        bio,
+        avatar_url,
+        created_at,
+        updated_at,
+    ) = row
     return {
-        "id": row[0],
-        "user_id": str(row[1]) if row[1] is not None else None,
-        "full_name": row[2],
-        "email": row[3],
-        "phone": row[4],
-        "address": row[5],
-        "bio": row[6],
-        "avatar_url": row[7],
-        "created_at": float(row[8]) if row[8] is not None else None,
-        "updated_at": float(row[9]) if row[9] is not None else None,
+        "id": profile_id,
+        "user_id": str(user_id) if user_id is not None else None,
+        "full_name": full_name,
+        "email": email,
+        "phone": phone,
+        "address": address,
+        "bio": bio,
+        "avatar_url": avatar_url,
+        "created_at": float(created_at) if created_at is not None else None,
+        "updated_at": float(updated_at) if updated_at is not None else None,
     }
 
 
@@ -67,7 +79,7 @@ async def create_profile(
     """
     conn = _get_connection(persistence)
     cursor = persistence._get_cursor()
-    now = datetime.now(timezone.utc).timestamp()
+    now = time.time()
 
     cursor.execute(
         """
@@ -173,7 +185,7 @@ async def update_profile(
     """
     conn = _get_connection(persistence)
     cursor = persistence._get_cursor()
-    now = datetime.now(timezone.utc).timestamp()
+    now = time.time()
 
     update_fields = []
     params = []
@@ -258,5 +270,4 @@ async def get_profiles(persistence: ProfilesPersistence) -> list[dict[str, t.Any
         """
     )
 
-    rows = cursor.fetchall()
-    return [_row_to_profile(row) for row in rows]
+    return [_row_to_profile(row) for row in cursor]
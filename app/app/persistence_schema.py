@@ -14,6 +14,7 @@ class SchemaPersistence(Protocol):
 
 def initialize_schema(persistence: SchemaPersistence) -> None:
     """Create all required tables and indexes for the application."""
+    enable_write_ahead_log(persistence)
     create_user_table(persistence)
     create_user_indexes(persistence)
     create_session_table(persistence)
@@ -36,6 +37,17 @@ def _get_connection(persistence: SchemaPersistence) -> sqlite3.Connection:
     return persistence.conn
 
 
+def enable_write_ahead_log(persistence: SchemaPersistence) -> None:
+    """
+    Switch the database file to WAL journaling.
+
+    The mode is stored in the database file, so this only has to run once; it
+    lets page reads proceed while another connection holds the write lock.
+    """
+    conn = _get_connection(persistence)
+    conn.execute("PRAGMA journal_mode = WAL")
+
+
 def create_user_table(persistence: SchemaPersistence) -> None:
     """
     Create the 'users' table in the database if it does not exist.
@@ -109,6 +121,10 @@ def create_user_indexes(persistence: SchemaPersistence) -> None:
     cursor.execute(
         "CREATE UNIQUE INDEX IF NOT EXISTS idx_users_email ON users(email)"
     )
+    # Email lookups compare lower(email), which idx_users_email cannot serve.
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_users_email_lower ON users(lower(email))"
+    )
     cursor.execute(
         "CREATE UNIQUE INDEX IF NOT EXISTS idx_users_username ON users(username) WHERE username IS NOT NULL"
     )
@@ -137,12 +153,16 @@ def create_currency_ledger_table(persistence: SchemaPersistence) -> None:
         )
         """
     )
+    # Ledger pages order by (created_at DESC, id DESC); carrying id in the
+    # index lets SQLite walk it in order and stop at LIMIT instead of sorting.
     cursor.execute(
         """
-        CREATE INDEX IF NOT EXISTS idx_currency_ledger_user_id_created
-        ON user_currency_ledger(user_id, created_at DESC)
+        CREATE INDEX IF NOT EXISTS idx_currency_ledger_user_created_id
+        ON user_currency_ledger(user_id, created_at DESC, id DESC)
         """
     )
+    # Superseded by the index above, which covers the same prefix.
+    cursor.execute("DROP INDEX IF EXISTS idx_currency_ledger_user_id_created")
     conn.commit()
 
 
@@ -295,6 +315,26 @@ def create_session_table(persistence: SchemaPersistence) -> None:
         )
     """
     )
+    # Sessions are revoked per user on password/role/status changes, and
+    # every new session sweeps rows past either expiry bound.
+    cursor.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_user_sessions_user_id
+        ON user_sessions(user_id)
+        """
+    )
+    cursor.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_user_sessions_valid_until
+        ON user_sessions(valid_until)
+        """
+    )
+    cursor.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_user_sessions_created_at
+        ON user_sessions(created_at)
+        """
+    )
     conn.commit()
 
 
@@ -485,6 +525,13 @@ def create_profiles_table(persistence: SchemaPersistence) -> None:
         )
         """
     )
+    # Profile listings are newest-first; walk the index instead of sorting.
+    cursor.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_profiles_created_at
+        ON profiles(created_at DESC)
+        """
+    )
     conn.commit()
 
 
@@ -539,4 +586,12 @@ def create_recovery_codes_table(persistence: SchemaPersistence) -> None:
         ON two_factor_recovery_codes(user_id)
         """
     )
+    # Verification only ever looks at a user's unused codes.
+    cursor.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_recovery_codes_active
+        ON two_factor_recovery_codes(user_id, code_hash)
+        WHERE used_at IS NULL
+        """
+    )
     conn.commit()
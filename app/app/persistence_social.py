@@ -4,6 +4,7 @@ import hmac
 import re
 import secrets
 import sqlite3
+import time
 import uuid
 from datetime import datetime, timedelta, timezone
 from typing import Protocol
@@ -210,23 +211,23 @@ async def create_oauth_pending_login(
     conn = _get_connection(persistence)
     _require_top_level_transaction(conn, operation="OAuth pending-login creation")
     cursor = persistence._get_cursor()
+    uid = str(user_id)
     try:
         # The writer lock establishes ordering against account deactivation.
         # Sample time and re-read account state only after the lock is owned,
         # then replace this browser's pending login without yielding.
         conn.execute("BEGIN IMMEDIATE")
-        now = datetime.now(timezone.utc)
-        valid_until = now + timedelta(minutes=ttl)
+        now_ts = time.time()
         cursor.execute(
             """
             DELETE FROM oauth_pending_logins
             WHERE valid_until <= ?
             """,
-            (now.timestamp(),),
+            (now_ts,),
         )
         cursor.execute(
             "SELECT is_active FROM users WHERE id = ?",
-            (str(user_id),),
+            (uid,),
         )
         user_row = cursor.fetchone()
         if user_row is None:
@@ -252,10 +253,10 @@ async def create_oauth_pending_login(
             (
                 binding_digest,
                 flow_id,
-                str(user_id),
+                uid,
                 provider,
-                now.timestamp(),
-                valid_until.timestamp(),
+                now_ts,
+                now_ts + timedelta(minutes=ttl).total_seconds(),
             ),
         )
         conn.commit()
@@ -280,7 +281,7 @@ async def create_oauth_reauth_challenge(
     if not auth_token:
         raise KeyError("A live session is required.")
 
-    now = datetime.now(timezone.utc)
+    now_ts = time.time()
     ttl = (
         config.OAUTH_HANDOFF_TTL_MINUTES
         if ttl_minutes is None
@@ -312,7 +313,7 @@ async def create_oauth_reauth_challenge(
             DELETE FROM oauth_login_handoffs
             WHERE valid_until <= ? OR consumed_at IS NOT NULL
             """,
-            (now.timestamp(),),
+            (now_ts,),
         )
         cursor.execute(
             """
@@ -325,8 +326,8 @@ async def create_oauth_reauth_challenge(
                 _hash_one_time_token(token),
                 str(user_id),
                 stored_provider,
-                now.timestamp(),
-                (now + timedelta(minutes=ttl)).timestamp(),
+                now_ts,
+                now_ts + timedelta(minutes=ttl).total_seconds(),
             ),
         )
         conn.commit()
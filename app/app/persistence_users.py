@@ -38,6 +38,35 @@ def get_user_select_columns(table_alias: str | None = None) -> str:
     )
 
 
+# Point lookups run on every login and guard, so their SQL is built once.
+_USER_BY_EMAIL_SQL = f"""
+    SELECT {USER_SELECT_COLUMNS}
+    FROM users
+    WHERE lower(email) = lower(?)
+    LIMIT 1
+"""
+_USER_BY_USERNAME_SQL = f"""
+    SELECT {USER_SELECT_COLUMNS}
+    FROM users
+    WHERE username = ?
+    LIMIT 1
+"""
+_USER_BY_ID_SQL = f"""
+    SELECT {USER_SELECT_COLUMNS}
+    FROM users
+    WHERE id = ?
+    LIMIT 1
+"""
+# An email match still wins over a username that equals the identifier.
+_USER_BY_IDENTITY_SQL = f"""
+    SELECT {USER_SELECT_COLUMNS}
+    FROM users
+    WHERE lower(email) = lower(?) OR username = ?
+    ORDER BY lower(email) = lower(?) DESC
+    LIMIT 1
+"""
+
+
 class UsersPersistence(Protocol):
     allow_username_login: bool
     conn: sqlite3.Connection | None
@@ -58,47 +87,54 @@ def _get_connection(persistence: UsersPersistence) -> sqlite3.Connection:
 
 def _row_to_app_user(row: tuple) -> AppUser:
     """Convert a database row into an AppUser instance."""
-    cfg = get_currency_config()
-    has_password_scheme = len(row) >= len(USER_SELECT_COLUMN_NAMES)
-    password_scheme = row[6] if has_password_scheme else "pbkdf2_sha256"
-    auth_provider_index = 7 if has_password_scheme else 6
-    updated_at_index = 17 if has_password_scheme else 15
-    updated_at_ts = row[updated_at_index] if len(row) > updated_at_index else None
+    # Every caller selects USER_SELECT_COLUMN_NAMES, and schema setup adds any
+    # missing columns, so the row always has exactly this shape.
+    (
+        user_id,
+        email,
+        username,
+        created_at_ts,
+        password_hash,
+        password_salt,
+        password_scheme,
+        auth_provider,
+        auth_provider_id,
+        role,
+        is_verified,
+        is_active,
+        two_factor_secret,
+        referral_code,
+        email_notifications_enabled,
+        sms_notifications_enabled,
+        primary_currency_balance,
+        updated_at_ts,
+    ) = row
     updated_at = (
         datetime.fromtimestamp(updated_at_ts, tz=timezone.utc)
         if updated_at_ts
         else datetime.now(timezone.utc)
     )
     return AppUser(
-        id=uuid.UUID(row[0]),
-        email=row[1],
-        username=row[2],
-        created_at=datetime.fromtimestamp(row[3], tz=timezone.utc),
-        password_hash=row[4],
-        password_salt=row[5],
+        id=uuid.UUID(user_id),
+        email=email,
+        username=username,
+        created_at=datetime.fromtimestamp(created_at_ts, tz=timezone.utc),
+        password_hash=password_hash,
+        password_salt=password_salt,
         password_scheme=password_scheme,
-        auth_provider=row[auth_provider_index],
-        auth_provider_id=row[auth_provider_index + 1],
-        role=row[auth_provider_index + 2],
-        is_verified=bool(row[auth_provider_index + 3]),
-        is_active=bool(row[auth_provider_index + 4]),
-        two_factor_secret=row[auth_provider_index + 5],
-        referral_code=row[auth_provider_index + 6],
-        email_notifications_enabled=(
-            bool(row[auth_provider_index + 7])
-            if len(row) > auth_provider_index + 7
-            else True
-        ),
-        sms_notifications_enabled=(
-            bool(row[auth_provider_index + 8])
-            if len(row) > auth_provider_index + 8
-            else False
-        ),
+        auth_provider=auth_provider,
+        auth_provider_id=auth_provider_id,
+        role=role,
+        is_verified=bool(is_verified),
+        is_active=bool(is_active),
+        two_factor_secret=two_factor_secret,
+        referral_code=referral_code,
+        email_notifications_enabled=bool(email_notifications_enabled),
+        sms_notifications_enabled=bool(sms_notifications_enabled),
         primary_currency_balance=(
-            int(row[auth_provider_index + 9])
-            if len(row) > auth_provider_index + 9
-            and row[auth_provider_index + 9] is not None
-            else cfg.initial_balance
+            int(primary_currency_balance)
+            if primary_currency_balance is not None
+            else get_currency_config().initial_balance
         ),
         primary_currency_updated_at=updated_at,
     )
@@ -116,6 +152,16 @@ def get_user_count(persistence: UsersPersistence) -> int:
     return int(cursor.fetchone()[0])
 
 
+async def email_exists(persistence: UsersPersistence, email: str) -> bool:
+    """Return whether any user is registered with the given email address."""
+    cursor = persistence._get_cursor()
+    cursor.execute(
+        "SELECT 1 FROM users WHERE lower(email) = lower(?) LIMIT 1",
+        (email,),
+    )
+    return cursor.fetchone() is not None
+
+
 async def get_user_by_email(
     persistence: UsersPersistence,
     email: str,
@@ -123,12 +169,7 @@ async def get_user_by_email(
     """Retrieve a user from the database by email address."""
     cursor = persistence._get_cursor()
     cursor.execute(
-        f"""
-        SELECT {USER_SELECT_COLUMNS}
-        FROM users
-        WHERE lower(email) = lower(?)
-        LIMIT 1
-        """,
+        _USER_BY_EMAIL_SQL,
         (email,),
     )
 
@@ -159,12 +200,7 @@ async def get_user_by_username(
     """
     cursor = persistence._get_cursor()
     cursor.execute(
-        f"""
-        SELECT {USER_SELECT_COLUMNS}
-        FROM users
-        WHERE username = ?
-        LIMIT 1
-        """,
+        _USER_BY_USERNAME_SQL,
         (username,),
     )
 
@@ -186,12 +222,22 @@ async def get_user_by_identity(
     This keeps email as the default login value while still supporting
     optional username-based flows for niche apps.
     """
-    try:
+    if not persistence.allow_username_login:
         return await get_user_by_email(persistence, identifier)
-    except KeyError:
-        if not persistence.allow_username_login:
-            raise
-        return await get_user_by_username(persistence, identifier)
+
+    # One round-trip for both lookups.
+    cursor = persistence._get_cursor()
+    cursor.execute(
+        _USER_BY_IDENTITY_SQL,
+        (identifier, identifier, identifier),
+    )
+
+    row = cursor.fetchone()
+
+    if row:
+        return _row_to_app_user(row)
+
+    raise KeyError(identifier)
 
 
 async def get_user_by_id(
@@ -214,12 +260,7 @@ async def get_user_by_id(
     cursor = persistence._get_cursor()
 
     cursor.execute(
-        f"""
-        SELECT {USER_SELECT_COLUMNS}
-        FROM users
-        WHERE id = ?
-        LIMIT 1
-        """,
+        _USER_BY_ID_SQL,
         (str(id),),
     )
 
@@ -261,9 +302,7 @@ async def list_users(
         query += " LIMIT ? OFFSET ?"
         parameters = (limit, offset)
     cursor.execute(query, parameters)
-
-    rows = cursor.fetchall()
-    return [_row_to_app_user(row) for row in rows]
+    return [_row_to_app_user(row) for row in cursor]
 
 
 async def get_user_by_email_or_username(
@@ -285,27 +324,8 @@ async def get_user_by_email_or_username(
 
     cursor = persistence._get_cursor()
     cursor.execute(
-        f"""
-        SELECT {USER_SELECT_COLUMNS}
-        FROM users
-        WHERE lower(email) = lower(?)
-        LIMIT 1
-        """,
-        (sanitized_identifier,),
-    )
-
-    row = cursor.fetchone()
-    if row:
-        return _row_to_app_user(row)
-
-    cursor.execute(
-        f"""
-        SELECT {USER_SELECT_COLUMNS}
-        FROM users
-        WHERE username = ?
-        LIMIT 1
-        """,
-        (sanitized_identifier,),
+        _USER_BY_IDENTITY_SQL,
+        (sanitized_identifier, sanitized_identifier, sanitized_identifier),
     )
 
     row = cursor.fetchone()
@@ -334,8 +354,6 @@ async def update_notification_preferences(
 
     `KeyError`: If the user does not exist
     """
-    await get_user_by_id(persistence, user_id)
-
     update_fields = []
     params = []
 
@@ -347,12 +365,17 @@ async def update_notification_preferences(
         update_fields.append("sms_notifications_enabled = ?")
         params.append(sms_notifications_enabled)
 
+    cursor = persistence._get_cursor()
+    uid = str(user_id)
     if not update_fields:
+        cursor.execute("SELECT 1 FROM users WHERE id = ?", (uid,))
+        if cursor.fetchone() is None:
+            raise KeyError(user_id)
         return
 
-    params.append(str(user_id))
+    params.append(uid)
 
-    cursor = persistence._get_cursor()
+    # The UPDATE's rowcount doubles as the existence check.
     cursor.execute(
         f"""
         UPDATE users
@@ -362,3 +385,5 @@ async def update_notification_preferences(
         params,
     )
     _get_connection(persistence).commit()
+    if cursor.rowcount == 0:
+        raise KeyError(user_id)
@@ -64,6 +64,11 @@ def get_password_strength(
     ).strength
 
 
+_WARNING_STYLE = rio.TextStyle(
+    fill=rio.Color.from_rgb(1, 0.6, 0, srgb=True),
+)
+
+
 def build_password_warning_acknowledgement(
     decision: PasswordPolicyDecision,
     *,
@@ -71,13 +76,10 @@ def build_password_warning_acknowledgement(
     on_change=None,
 ) -> rio.Component:
     """Render policy warnings and their explicit, narrow-safe acknowledgement."""
-    warning_style = rio.TextStyle(
-        fill=rio.Color.from_rgb(1, 0.6, 0, srgb=True),
-    )
     warning_texts = [
         rio.Text(
             warning.message,
-            style=warning_style,
+            style=_WARNING_STYLE,
             overflow="wrap",
             grow_x=True,
         )
@@ -87,7 +89,7 @@ def build_password_warning_acknowledgement(
         warning_texts.append(
             rio.Text(
                 decision.message,
-                style=warning_style,
+                style=_WARNING_STYLE,
                 overflow="wrap",
                 grow_x=True,
             )
@@ -103,7 +105,7 @@ def build_password_warning_acknowledgement(
             *warning_texts,
             rio.Text(
                 "I understand these warnings and want to use this password.",
-                style=warning_style,
+                style=_WARNING_STYLE,
                 overflow="wrap",
                 grow_x=True,
             ),
@@ -116,15 +118,49 @@ def build_password_warning_acknowledgement(
     )
 
 
+def _build_password_strength_color(score: int) -> rio.Color:
+    red = (99 - score) / 99
+    green = score / 99
+    return rio.Color.from_rgb(red, green, 0, srgb=True)
+
+
+# Scores are clamped to 0-99, so every color the strength meter can show is
+# built once at import instead of on each keystroke-driven rebuild.
+_STRENGTH_COLORS = tuple(
+    _build_password_strength_color(score) for score in range(100)
+)
+
+
 def get_password_strength_color(score: int) -> rio.Color:
     """
     Takes a password strength score (0-99) and returns a color between red and
     green.
     """
-    score = max(0, min(score, 99))
-    red = (99 - score) / 99
-    green = score / 99
-    return rio.Color.from_rgb(red, green, 0, srgb=True)
+    return _STRENGTH_COLORS[max(0, min(score, 99))]
+
+
+_STRENGTH_STYLES = tuple(rio.TextStyle(fill=color) for color in _STRENGTH_COLORS)
+
+
+def get_password_strength_style(score: int) -> rio.TextStyle:
+    """
+    Returns the cached text style used to render a password strength label.
+    """
+    return _STRENGTH_STYLES[max(0, min(score, 99))]
+
+
+def get_password_strength_progress(score: int) -> float:
+    """
+    Returns the progress-bar fraction (0.0 to 1.0) for a password strength score.
+    """
+    return max(0.0, min(score / 100, 1.0))
+
+
+# Pass/fail styles for live form validation feedback (email shape, password
+# confirmation). Built once and shared by the login and settings pages.
+VALIDATION_OK_STYLE = rio.TextStyle(fill=rio.Color.from_rgb(0, 1, 0, srgb=True))
+VALIDATION_BAD_STYLE = rio.TextStyle(fill=rio.Color.from_rgb(1, 0, 0, srgb=True))
+
 
 def get_password_strength_status(score: int) -> str:
     """
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 
 import rio
@@ -93,7 +94,7 @@ async def verify_step_up_credentials(
     uses_password = user.auth_provider == "password"
 
     if uses_password:
-        if not user.verify_password(password):
+        if not await asyncio.to_thread(user.verify_password, password):
             return StepUpResult(ok=False, error_message="Current password is incorrect")
     elif not user.two_factor_enabled:
         # No password leg available and no 2FA to fall back on.
@@ -34,6 +34,33 @@ MAX_URL_LENGTH = 2048
 # decimal places, while being far larger than any realistic balance.
 MAX_CURRENCY_AMOUNT = Decimal("1000000000000")
 
+# Email validation runs on every sign-up keystroke, so the suspicious-pattern
+# check is compiled once into a single alternation.
+SUSPICIOUS_EMAIL_PATTERN = re.compile(
+    r'javascript:|data:|vbscript:|onload=|onerror='
+)
+
+# Whole-string validators; `fullmatch` needs no anchors and, unlike `$`, does
+# not accept a trailing newline.
+PHONE_NUMBER_PATTERN = re.compile(r'[\d\s\-\(\)\+]+')
+USER_ID_PATTERN = re.compile(r'[a-zA-Z0-9_-]+')
+
+# sanitize_string runs on most free-text input, so its patterns are compiled
+# once; the SQL keyword checks are folded into a single alternation.
+CONTROL_CHARACTER_PATTERN = re.compile(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]')
+SQL_INJECTION_PATTERN = re.compile(
+    r'union\s+select|insert\s+into|delete\s+from|update\s+\w+\s+set|'
+    r'drop\s+table|alter\s+table|create\s+table|exec\s*\(|script\s*>'
+)
+
+URL_PATTERN = re.compile(
+    r'^https?://'  # http:// or https://
+    r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
+    r'localhost|'  # localhost...
+    r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
+    r'(?::\d+)?'  # optional port
+    r'(?:/?|[/?]\S+)$', re.IGNORECASE)
+
 
 class SecuritySanitizer:
     """Utility class for sanitizing user input to prevent security vulnerabilities."""
@@ -64,7 +91,7 @@ class SecuritySanitizer:
         sanitized = html.escape(sanitized)
         
         # Remove null bytes and other control characters
-        sanitized = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]', '', sanitized)
+        sanitized = CONTROL_CHARACTER_PATTERN.sub('', sanitized)
         
         # Check length after sanitization
         if len(sanitized) > max_length:
@@ -74,18 +101,11 @@ class SecuritySanitizer:
             )
         
         # Check for potential SQL injection patterns (basic detection)
-        sql_patterns = [
-            r'(union\s+select)', r'(insert\s+into)', r'(delete\s+from)',
-            r'(update\s+\w+\s+set)', r'(drop\s+table)', r'(alter\s+table)',
-            r'(create\s+table)', r'(exec\s*\()', r'(script\s*>)'
-        ]
-        
-        for pattern in sql_patterns:
-            if re.search(pattern, sanitized.lower()):
-                raise HTTPException(
-                    status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
-                    detail="Input contains potentially dangerous content."
-                )
+        if SQL_INJECTION_PATTERN.search(sanitized.lower()):
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+                detail="Input contains potentially dangerous content."
+            )
         
         return sanitized
 
@@ -172,16 +192,11 @@ class SecuritySanitizer:
             normalized_email = email_info.normalized.lower()
         
         # Always check for suspicious patterns (security measure).
-        suspicious_patterns = [
-            r'javascript:', r'data:', r'vbscript:', r'onload=', r'onerror='
-        ]
-        
-        for pattern in suspicious_patterns:
-            if re.search(pattern, normalized_email):
-                raise HTTPException(
-                    status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
-                    detail="Email contains invalid characters or patterns."
-                )
+        if SUSPICIOUS_EMAIL_PATTERN.search(normalized_email):
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+                detail="Email contains invalid characters or patterns."
+            )
         
         return normalized_email
     
@@ -212,7 +227,7 @@ class SecuritySanitizer:
             )
         
         # Allow only digits, spaces, dashes, parentheses, and plus sign
-        if not re.match(r'^[\d\s\-\(\)\+]+$', phone):
+        if not PHONE_NUMBER_PATTERN.fullmatch(phone):
             raise HTTPException(
                 status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
                 detail="Phone number contains invalid characters. Only digits, spaces, dashes, parentheses, and plus sign are allowed."
@@ -246,15 +261,7 @@ class SecuritySanitizer:
             )
         
         # Basic URL format validation
-        url_pattern = re.compile(
-            r'^https?://'  # http:// or https://
-            r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
-            r'localhost|'  # localhost...
-            r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
-            r'(?::\d+)?'  # optional port
-            r'(?:/?|[/?]\S+)$', re.IGNORECASE)
-        
-        if not url_pattern.match(url):
+        if not URL_PATTERN.match(url):
             raise HTTPException(
                 status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
                 detail="Invalid URL format. Must be a valid HTTP or HTTPS URL."
@@ -289,7 +296,7 @@ class ProfileCreateRequest(BaseModel):
     @field_validator('user_id')
     def validate_user_id(cls, v):
         # User ID should be alphanumeric with underscores and hyphens only
-        if not re.match(r'^[a-zA-Z0-9_-]+$', v):
+        if not USER_ID_PATTERN.fullmatch(v):
             raise ValueError('User ID can only contain letters, numbers, underscores, and hyphens')
         return SecuritySanitizer.sanitize_string(v, 50)
     
@@ -1,4 +1,5 @@
 import asyncio
+import concurrent.futures
 import sqlite3
 from pathlib import Path
 
@@ -160,3 +161,33 @@ def test_uncommitted_recovery_code_cleanup_requires_a_transaction(
             user.id,
             commit=False,
         )
+
+
+def test_optimize_does_not_open_a_connection_for_an_unused_thread(
+    temp_db: Persistence,
+):
+    def optimize_on_fresh_thread() -> bool:
+        temp_db.optimize()
+        return temp_db.conn is None
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        assert executor.submit(optimize_on_fresh_thread).result() is True
+
+
+def test_optimize_logs_and_skips_a_locked_database(
+    temp_db: Persistence,
+    caplog: pytest.LogCaptureFixture,
+):
+    class _LockedConnection:
+        def execute(self, *args, **kwargs):
+            raise sqlite3.OperationalError("database is locked")
+
+    real_conn = temp_db.conn
+    temp_db.conn = _LockedConnection()
+    try:
+        with caplog.at_level("WARNING", logger="app.persistence"):
+            temp_db.optimize()
+    finally:
+        temp_db.conn = real_conn
+
+    assert "Skipped PRAGMA optimize" in caplog.text
@@ -121,6 +121,8 @@ def _mount_component(component_cls, session: _FakeSession, **attributes):
         component.password_policy_error_visible = False
         component.prefilled_email = ""
         component.prefilled_username = ""
+        component._password_policy = None
+        component._password_policy_input = None
     if component_cls is SignUpForm:
         component.email = ""
         component.password = ""
@@ -134,6 +136,8 @@ def _mount_component(component_cls, session: _FakeSession, **attributes):
         component.do_passwords_match = False
         component.acknowledge_weak_password = False
         component.password_policy_error_visible = False
+        component._password_policy = None
+        component._password_policy_input = None
     for key, value in attributes.items():
         setattr(component, key, value)
     return component
@@ -164,14 +168,14 @@ def test_signup_strength_meter_tracks_live_email_context(temp_db: Persistence):
             email="unrelated@example.com",
         )
 
-        await SignUpForm.update_password(
+        SignUpForm.update_password(
             form,
             rio.TextInputChangeEvent(password),
         )
         assert form.password_strength >= config.PASSWORD_STRENGTH_WARNING_THRESHOLD
 
         form.acknowledge_weak_password = True
-        await SignUpForm.update_email(
+        SignUpForm.update_email(
             form,
             rio.TextInputChangeEvent(password),
         )
@@ -181,6 +185,25 @@ def test_signup_strength_meter_tracks_live_email_context(temp_db: Persistence):
     asyncio.run(scenario())
 
 
+def test_signup_cancel_drops_cached_password_policy_input(temp_db: Persistence):
+    form = _mount_component(
+        SignUpForm,
+        _FakeSession(temp_db),
+        on_toggle_form=None,
+    )
+    SignUpForm.update_password(
+        form,
+        rio.TextInputChangeEvent("CancelledPass!9"),
+    )
+    assert form._password_policy_input is not None
+
+    SignUpForm.on_cancel(form)
+
+    assert form.password == ""
+    assert form._password_policy is None
+    assert form._password_policy_input is None
+
+
 def test_reset_strength_meter_tracks_live_identifier_context(
     temp_db: Persistence,
 ):
@@ -198,6 +221,7 @@ def test_reset_strength_meter_tracks_live_identifier_context(
             rio.TextInputChangeEvent(password),
         )
         assert form.password_strength >= config.PASSWORD_STRENGTH_WARNING_THRESHOLD
+        assert form._password_strength_progress == form.password_strength / 100
 
         form.acknowledge_weak_password = True
         await ResetPasswordForm.update_email(
@@ -220,6 +244,31 @@ def test_reset_strength_meter_tracks_live_identifier_context(
     asyncio.run(scenario())
 
 
+def test_reset_token_entry_drops_cached_password_policy_input(
+    temp_db: Persistence,
+):
+    async def scenario():
+        form = _mount_component(
+            ResetPasswordForm,
+            _FakeSession(temp_db),
+            code_sent=True,
+            email="reset-cache@example.com",
+        )
+        await ResetPasswordForm.update_new_password(
+            form,
+            rio.TextInputChangeEvent("AbandonedPass!9"),
+        )
+        assert form._password_policy_input is not None
+
+        ResetPasswordForm._show_reset_token_entry(form, "reset-cache@example.com")
+
+        assert form.new_password == ""
+        assert form._password_policy is None
+        assert form._password_policy_input is None
+
+    asyncio.run(scenario())
+
+
 def test_reset_resolved_username_policy_error_precedes_mfa(
     temp_db: Persistence,
 ):
@@ -268,7 +317,7 @@ def test_public_password_edits_clear_only_policy_banners(
             acknowledge_weak_password=True,
             password_policy_error_visible=True,
         )
-        await SignUpForm.update_password(
+        SignUpForm.update_password(
             signup,
             rio.TextInputChangeEvent("ChangedSignupPassword!2026"),
         )
@@ -69,6 +69,63 @@ def test_verify_step_up_credentials_password_only(temp_db: Persistence):
     asyncio.run(scenario())
 
 
+def test_verify_step_up_credentials_checks_password_off_the_event_loop(
+    temp_db: Persistence,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    offloaded: list[str] = []
+    original_to_thread = asyncio.to_thread
+
+    async def recording_to_thread(func, /, *args, **kwargs):
+        offloaded.append(func.__name__)
+        return await original_to_thread(func, *args, **kwargs)
+
+    async def scenario():
+        root, root_session = await _create_root_session(temp_db)
+        monkeypatch.setattr(asyncio, "to_thread", recording_to_thread)
+
+        result = await verify_step_up_credentials(
+            temp_db,
+            root_session,
+            root,
+            password=PASSWORD,
+            two_factor_code=None,
+        )
+
+        assert result.ok is True
+        assert offloaded == ["verify_password"]
+
+    asyncio.run(scenario())
+
+
+def test_admin_create_user_hashes_password_off_the_event_loop(
+    temp_db: Persistence,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    offloaded: list[str] = []
+    original_to_thread = asyncio.to_thread
+
+    async def recording_to_thread(func, /, *args, **kwargs):
+        offloaded.append(func.__name__)
+        return await original_to_thread(func, *args, **kwargs)
+
+    async def scenario():
+        _, root_session = await _create_root_session(temp_db)
+        monkeypatch.setattr(asyncio, "to_thread", recording_to_thread)
+
+        created = await temp_db.admin_create_user(
+            email="offloaded-hash@example.com",
+            password=PASSWORD,
+            role="user",
+            admin_context=_admin_context(root_session),
+        )
+
+        assert created.verify_password(PASSWORD)
+        assert offloaded == ["create_new_user_with_default_settings"]
+
+    asyncio.run(scenario())
+
+
 def test_verify_step_up_credentials_tells_oauth_user_to_set_up_2fa(
     temp_db: Persistence,
 ):
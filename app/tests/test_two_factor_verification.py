@@ -7,6 +7,7 @@ import pyotp
 import pytest
 
 from app.data_models import AppUser
+from app import persistence_auth
 from app.persistence import Persistence
 from app.persistence_auth import TwoFactorFailure, TwoFactorMethod
 
@@ -92,6 +93,25 @@ def test_verify_two_factor_consumes_recovery_code(temp_db: Persistence):
     asyncio.run(scenario())
 
 
+def test_recovery_code_ignores_case_hyphens_and_pasted_whitespace(
+    temp_db: Persistence,
+):
+    async def scenario():
+        user = await _create_user(temp_db, "pasted@example.com")
+        temp_db.set_2fa_secret(user.id, pyotp.random_base32())
+        recovery_code = temp_db.generate_recovery_codes(user.id, count=1)[0]
+        pasted = recovery_code.lower().replace("-", " - ")
+
+        assert persistence_auth.consume_recovery_code(
+            temp_db, user.id, pasted
+        ) is True
+        assert persistence_auth.consume_recovery_code(
+            temp_db, user.id, recovery_code
+        ) is False
+
+    asyncio.run(scenario())
+
+
 def test_verify_two_factor_rejects_invalid_format(temp_db: Persistence):
     async def scenario():
         user = await _create_user(temp_db, "format@example.com")
@@ -51,6 +51,52 @@ def test_user_listing_pages_are_stable_and_non_overlapping(temp_db: Persistence)
     asyncio.run(scenario())
 
 
+def test_email_exists_matches_registered_email_case_insensitively(
+    temp_db: Persistence,
+):
+    async def scenario():
+        await _create_user(temp_db, "existing-user@example.com")
+
+        assert await temp_db.email_exists("Existing-User@Example.com")
+        assert not await temp_db.email_exists("missing-user@example.com")
+
+    asyncio.run(scenario())
+
+
+def test_identity_lookup_prefers_email_over_username(tmp_path: Path):
+    persistence = Persistence(
+        db_path=tmp_path / "identity.db",
+        allow_username_login=True,
+    )
+
+    async def scenario():
+        by_email = await _create_user(persistence, "shared-id@example.com")
+        by_username = AppUser.create_new_user_with_default_settings(
+            email="other-user@example.com",
+            password="VeryStrongPass!9",
+            username="shared-id@example.com",
+        )
+        await persistence._create_user_unchecked(by_username)
+        handle_only = AppUser.create_new_user_with_default_settings(
+            email="handle-user@example.com",
+            password="VeryStrongPass!9",
+            username="handle-only",
+        )
+        await persistence._create_user_unchecked(handle_only)
+
+        found = await persistence.get_user_by_identity("shared-id@example.com")
+        assert found.id == by_email.id
+        found = await persistence.get_user_by_identity("handle-only")
+        assert found.id == handle_only.id
+        with pytest.raises(KeyError):
+            await persistence.get_user_by_identity("missing-user")
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        persistence.close()
+
+
 @pytest.mark.parametrize(
     ("limit", "offset", "message"),
     [